@@ -1,22 +1,54 @@
-from flask import Flask, jsonify, request, Response
-from flask_bcrypt import Bcrypt
-from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity
+from flask import Flask, jsonify, request, Response, g, stream_with_context, has_request_context
+from flask_bcrypt import Bcrypt, generate_password_hash, check_password_hash
+from flask_jwt_extended import JWTManager, create_access_token, create_refresh_token, jwt_required, get_jwt_identity
 from dotenv import load_dotenv
-from datetime import datetime
-import sqlite3, os, json
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from validation import Schema, Field
+import sqlite3, os, json, queue, threading, time, hashlib, re, click, csv, io, zlib, multiprocessing
+import numpy as np
 
 app = Flask(__name__)
-bcrypt = Bcrypt(app)
 load_dotenv()
 
-DATABASE = '/app/database.db'
+PASSWORD_HASH_ROUNDS = int(os.getenv('PASSWORD_HASH_ROUNDS', '12'))
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '64'))
+PASSWORD_HASH_TIMEOUT = float(os.getenv('PASSWORD_HASH_TIMEOUT', '10'))
+app.config['BCRYPT_LOG_ROUNDS'] = PASSWORD_HASH_ROUNDS
+bcrypt = Bcrypt(app)
+
+DATABASE = os.getenv('DATABASE', '/app/database.db')
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '8'))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv('DB_STATEMENT_CACHE_SIZE', '256'))
+DB_MMAP_SIZE = int(os.getenv('DB_MMAP_SIZE', str(256 * 1024 * 1024)))
+DB_CACHE_SIZE_KB = int(os.getenv('DB_CACHE_SIZE_KB', str(64 * 1024)))
+WRITE_GROUP_MAX_SIZE = int(os.getenv('WRITE_GROUP_MAX_SIZE', '64'))
+WRITE_GROUP_MAX_DELAY = float(os.getenv('WRITE_GROUP_MAX_DELAY', '0.002'))
+READ_REPLICA = os.getenv('READ_REPLICA', 'false').lower() in ('1', 'true', 'yes')
+READ_REPLICA_INTERVAL = float(os.getenv('READ_REPLICA_INTERVAL', '5.0'))
+READ_REPLICA_COMMITS = int(os.getenv('READ_REPLICA_COMMITS', '0'))
+SQL_TRACE = os.getenv('SQL_TRACE', 'false').lower() in ('1', 'true', 'yes')
+SQL_SLOW_QUERY_MS = float(os.getenv('SQL_SLOW_QUERY_MS', '50'))
+SQL_SLOW_QUERY_LOG = os.getenv('SQL_SLOW_QUERY_LOG', 'slow_queries.log')
+CHANGES_MAX_WAIT = float(os.getenv('CHANGES_MAX_WAIT', '30'))
+CHANGES_POLL_INTERVAL = float(os.getenv('CHANGES_POLL_INTERVAL', '1.0'))
 app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'fallback-secret-key')
+TOKEN_REVOCATION_CHECK_INTERVAL = float(os.getenv('TOKEN_REVOCATION_CHECK_INTERVAL', '5.0'))
 jwt = JWTManager(app)
 
 allowed_employment_statuses = ['employed', 'unemployed']
 allowed_sexes = ['male', 'female']
 allowed_marital_status = ['single', 'married', 'widowed', 'divorced']
 
+# Child age bands (in years, inclusive) that satisfy a scheme's school_level criterion
+SCHOOL_LEVEL_AGES = {
+    'primary': (7, 12),
+    'secondary': (13, 16),
+}
+
 scheme_example = {
             "name": "Retrenchment Assistance Scheme",
             "criteria": {
@@ -34,10 +66,791 @@ scheme_example = {
             ]
         }
 
+allowed_schemes = ["Retrenchment Assistance Scheme", "Retrenchment Assistance Scheme (families)"]
+
+applicant_example = {
+    "name": "Mary",
+    "employment_status": "unemployed",
+    "sex": "female",
+    "date_of_birth": "1984-10-06",
+    "marital_status": "married",
+    "household": [
+        {
+            "name": "Gwen",
+            "employment_status": "unemployed",
+            "sex": "female",
+            "date_of_birth": "2016-02-01",
+            "relation": "daughter"
+        },
+        {
+            "name": "Jayden",
+            "employment_status": "unemployed",
+            "sex": "male",
+            "date_of_birth": "2018-03-15",
+            "relation": "son"
+        }
+    ]
+}
+
+application_example = {
+    "name": "jason",
+    "date_of_birth": "1990-01-01",
+    "scheme_applied": "Retrenchment Assistance Scheme"
+}
+
+household_member_schema = Schema(
+    Field('name', types=str, message='Household member must have a name.',
+          type_message='Household member name must be a string.'),
+    Field('employment_status', choices=allowed_employment_statuses,
+          message='Invalid employment status for household member {name}.'),
+    Field('sex', choices=allowed_sexes, message='Invalid sex for household member {name}.'),
+    Field('date_of_birth', types=str, message='Household member {name} must have a date of birth.',
+          type_message='Date of birth of household member {name} must be a string.'),
+    Field('relation', types=str, message='Household member {name} must have a relation to the applicant.',
+          type_message='Relation of household member {name} must be a string.'),
+)
+
+applicant_schema = Schema(
+    Field('name', types=str, message='Name is required.', type_message='Name must be a string.'),
+    Field('employment_status', choices=allowed_employment_statuses, message='Invalid employment status'),
+    Field('sex', choices=allowed_sexes, message='Invalid sex'),
+    Field('date_of_birth', types=str, message='Date of birth is required', type_message='Date of birth must be a string.'),
+    Field('marital_status', choices=allowed_marital_status, message='Invalid marital status'),
+    Field('household', required=False, allow_empty=True, items=household_member_schema,
+          message='Household must be a list', item_message='Each household member must be an object.'),
+)
+
+scheme_schema = Schema(
+    Field('name', types=str, message="'name' is required for the scheme.", type_message="'name' must be a string."),
+    Field('criteria', allow_empty=True, message="'criteria' is required and must be an object.", schema=Schema(
+        Field('employment_status', allow_empty=True, types=(str, type(None)),
+              message="'employment_status' is required in the criteria.",
+              type_message="'employment_status' must be a string or null."),
+        Field('has_children', required=False, allow_empty=True, message="'has_children' must be an object.", schema=Schema(
+            # null means any child; any other level must have an age band, or the scheme would match no one
+            Field('school_level', allow_empty=True, choices=list(SCHOOL_LEVEL_AGES) + [None],
+                  message="'school_level' is required when 'has_children' is specified.",
+                  choices_message=f"'school_level' must be one of {list(SCHOOL_LEVEL_AGES)} or null."),
+        )),
+    )),
+    Field('benefits', allow_empty=True, message="'benefits' is required and must be a list.",
+          item_message="Each benefit must be an object.", items=Schema(
+        Field('name', types=str, message="Each benefit must have a 'name'.", type_message="Each benefit 'name' must be a string."),
+        Field('amount', allow_empty=True, types=(int, float), message="Each benefit must have a valid 'amount'."),
+    )),
+)
+
+application_schema = Schema(
+    Field('name', types=str, message='Name is required.', type_message='Name must be a string.'),
+    Field('date_of_birth', types=str, message='Date of birth is required.', type_message='Date of birth must be a string.'),
+    Field('scheme_applied', choices=allowed_schemes, message=f'Scheme applied must be one of {allowed_schemes}'),
+)
+
+def validation_failed(errors, example):
+    # 'Error' keeps the first problem for existing clients; 'Errors' lists every problem found
+    return jsonify({
+        'Error': errors[0],
+        'Errors': errors,
+        'Example JSON Format': example
+    }), 400
+
+class QueryStats(threading.local):
+    """SQL statements, SQL time and pooled connections used so far by the work on this thread."""
+
+    queries = 0
+    seconds = 0.0
+    connections = 0
+
+    def __init__(self):
+        # Statements SQLite reports through the trace callback, including trigger bodies
+        self.traced = []
+
+    def reset(self):
+        self.queries, self.seconds, self.connections = 0, 0.0, 0
+
+query_stats = QueryStats()
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor that adds each statement and the time spent executing and fetching it to query_stats.
+
+    With SQL_TRACE on, a statement is also written to the slow query log once its execute and fetch
+    time together pass SQL_SLOW_QUERY_MS.
+    """
+
+    _sql = None
+    _parameters = None
+    _elapsed = 0.0
+
+    def _timed(self, call, *args):
+        if slow_query_log is not None:
+            traced_before = len(query_stats.traced)
+        started = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            query_stats.seconds += elapsed
+            if slow_query_log is not None and self._sql is not None:
+                self._elapsed += elapsed
+                if self._elapsed >= slow_query_log.threshold:
+                    slow_query_log.record(self.connection, self._sql, self._parameters, self._elapsed,
+                                          query_stats.traced[traced_before:])
+                    # Logged once per statement
+                    self._sql = None
+                del query_stats.traced[:]
+
+    def _start(self, sql, parameters):
+        query_stats.queries += 1
+        if slow_query_log is not None:
+            self._sql, self._parameters, self._elapsed = sql, parameters, 0.0
+
+    def execute(self, sql, parameters=()):
+        self._start(sql, parameters)
+        return self._timed(super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._start(sql, None)
+        return self._timed(super().executemany, sql, seq_of_parameters)
+
+    def fetchone(self):
+        return self._timed(super().fetchone)
+
+    def fetchmany(self, *args):
+        return self._timed(super().fetchmany, *args)
+
+    def fetchall(self):
+        return self._timed(super().fetchall)
+
+class TimedConnection(sqlite3.Connection):
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, *args):
+        return self.cursor().execute(*args)
+
+    def executemany(self, *args):
+        return self.cursor().executemany(*args)
+
+class SlowQueryLog:
+    """Appends statements slower than the threshold to a JSON-lines file, with their query plan."""
+
+    def __init__(self, path, threshold):
+        self.path = path
+        self.threshold = threshold
+        self._lock = threading.Lock()
+
+    def record(self, conn, sql, parameters, seconds, traced):
+        entry = {
+            'at': datetime.now().isoformat(timespec='milliseconds'),
+            'sql': normalize_sql(sql),
+            'ms': round(seconds * 1000, 3),
+            # Only the types of bound values are logged, never the applicant data itself
+            'parameters': parameter_shape(parameters),
+            'source': request.endpoint if has_request_context() else threading.current_thread().name,
+            'pid': os.getpid(),
+            'statements': len(traced),
+            'triggers': [statement[len('-- TRIGGER '):] for statement in traced if statement.startswith('-- TRIGGER ')],
+            'plan': query_plan(conn, sql, parameters),
+        }
+        line = json.dumps(entry) + '\n'
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line)
+
+def normalize_sql(sql):
+    # Collapse whitespace and IN (?, ?, ...) lists so the same statement groups together whatever its chunk size
+    sql = ' '.join(sql.split())
+    return re.sub(r'\?(, \?)+', '?, ...', sql)
+
+def parameter_shape(parameters):
+    # executemany statements are logged without parameters or plan
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    return [type(value).__name__ for value in parameters]
+
+def query_plan(conn, sql, parameters):
+    if parameters is None:
+        return None
+    try:
+        # A plain cursor, so the plan lookup itself is neither counted nor logged
+        rows = conn.cursor(sqlite3.Cursor).execute(f'EXPLAIN QUERY PLAN {sql}', parameters).fetchall()
+    except sqlite3.Error:
+        return None
+    return [row[3] for row in rows]
+
+def trace_statement(statement):
+    # Connections move between threads, so always append to the calling thread's list
+    query_stats.traced.append(statement)
+
+slow_query_log = SlowQueryLog(SQL_SLOW_QUERY_LOG, SQL_SLOW_QUERY_MS / 1000) if SQL_TRACE else None
+
+@app.cli.command('slow-queries')
+@click.option('--limit', default=20, show_default=True, help='Number of statements to show.')
+@click.option('--log', 'path', default=SQL_SLOW_QUERY_LOG, show_default=True, help='Slow query log to read.')
+def slow_queries_command(limit, path):
+    """Rank the statements in the slow query log by total time."""
+    if not os.path.exists(path):
+        print(f'No slow query log at {path}. Set SQL_TRACE=true to record one.')
+        return
+
+    statements = {}
+    with open(path) as f:
+        for line in f:
+            entry = json.loads(line)
+            stats = statements.setdefault(entry['sql'], {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'sources': set()})
+            stats['count'] += 1
+            stats['total_ms'] += entry['ms']
+            stats['max_ms'] = max(stats['max_ms'], entry['ms'])
+            stats['sources'].add(entry['source'])
+            stats['plan'] = entry['plan'] or stats.get('plan')
+
+    ranked = sorted(statements.items(), key=lambda item: item[1]['total_ms'], reverse=True)
+    for sql, stats in ranked[:limit]:
+        print(f"{stats['total_ms']:.1f} ms in {stats['count']} slow runs (max {stats['max_ms']:.1f} ms) "
+              f"from {', '.join(sorted(stats['sources']))}")
+        print(f'  {sql}')
+        for step in stats.get('plan') or []:
+            print(f'    {step}')
+
+class ConnectionPool:
+    """Keeps a bounded set of tuned SQLite connections for reuse across requests."""
+
+    def __init__(self, database, size):
+        self.database = database
+        self.size = size
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+
+    def connect(self):
+        # cached_statements is sqlite3's per-connection prepared statement cache
+        conn = sqlite3.connect(
+            self.database,
+            timeout=30,
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+            factory=TimedConnection
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute(f'PRAGMA mmap_size = {DB_MMAP_SIZE}')
+        conn.execute(f'PRAGMA cache_size = -{DB_CACHE_SIZE_KB}')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        if slow_query_log is not None:
+            conn.set_trace_callback(trace_statement)
+        metrics.connection_opened()
+        return conn
+
+    def acquire(self):
+        query_stats.connections += 1
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self.connect()
+
+    def release(self, conn):
+        # Never hand a half-finished transaction to the next request
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def idle_count(self):
+        return self._idle.qsize()
+
+    def close_all(self):
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+db_pool = ConnectionPool(DATABASE, DB_POOL_SIZE)
+
 def get_db_connection():
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
-    return conn
+    # One pooled connection per app/request context, returned on teardown
+    if 'db' not in g:
+        g.db = db_pool.acquire()
+    return g.db
+
+@contextmanager
+def pooled_connection():
+    # For code that runs outside a request, e.g. CLI commands and background threads
+    conn = db_pool.acquire()
+    try:
+        yield conn
+    finally:
+        db_pool.release(conn)
+
+@app.teardown_appcontext
+def release_db_connection(exception):
+    conn = g.pop('db', None)
+    if conn is not None:
+        db_pool.release(conn)
+    replica = g.pop('replica', None)
+    if replica is not None:
+        read_replica.release(replica)
+
+class WriteCoalescer:
+    """Single writer thread that commits submitted write units in small group transactions.
+
+    A write unit is a callable taking a connection; it must not commit. Each unit runs in its own
+    savepoint, so a failing unit is rolled back alone and its exception goes to its own caller,
+    while the rest of the group still commits with one fsync.
+    """
+
+    def __init__(self, max_size, max_delay):
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._after_commit = []
+
+    def start(self):
+        # Started on first use so each forked server worker runs its own writer
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='sqlite-writer', daemon=True)
+                self._thread.start()
+
+    def submit(self, unit, *args):
+        future = Future()
+        self.start()
+        self._queue.put((future, unit, args))
+        return future
+
+    def execute(self, unit, *args):
+        return self.submit(unit, *args).result()
+
+    def after_commit(self, callback, *args):
+        # Lets a write unit act once its writes are visible to readers; outside the writer it runs at once
+        if threading.current_thread() is self._thread:
+            self._after_commit.append((callback, args))
+        else:
+            callback(*args)
+
+    @contextmanager
+    def savepoint(self, conn, name='write_unit'):
+        """Runs a block in a savepoint; on error it is rolled back along with the after_commit callbacks it added."""
+        mark = len(self._after_commit)
+        conn.execute(f'SAVEPOINT {name}')
+        try:
+            yield
+        except Exception:
+            conn.execute(f'ROLLBACK TO {name}')
+            conn.execute(f'RELEASE {name}')
+            del self._after_commit[mark:]
+            raise
+        conn.execute(f'RELEASE {name}')
+
+    def _next_group(self):
+        group = [self._queue.get()]
+        deadline = time.monotonic() + self.max_delay
+        while len(group) < self.max_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                group.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return group
+
+    def _run(self):
+        conn = db_pool.connect()
+        conn.isolation_level = None
+        while True:
+            group = self._next_group()
+            outcomes = []
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                for future, unit, args in group:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with self.savepoint(conn):
+                            result = unit(conn, *args)
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+                    else:
+                        outcomes.append((future, result, None))
+                conn.execute('COMMIT')
+                read_replica.note_commit()
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                for future, unit, args in group:
+                    if not future.done():
+                        future.set_exception(e)
+                self._after_commit = []
+                metrics.record_sql('sqlite-writer')
+                continue
+
+            for callback, args in self._after_commit:
+                callback(*args)
+            self._after_commit = []
+
+            for future, result, error in outcomes:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            metrics.record_sql('sqlite-writer')
+
+write_coalescer = WriteCoalescer(WRITE_GROUP_MAX_SIZE, WRITE_GROUP_MAX_DELAY)
+
+class ReadReplica:
+    """In-memory copy of the database for read-only handlers, re-copied from disk with the backup API.
+
+    Each refresh copies into a new shared-cache memory database and then moves readers over to it, so
+    reads never wait on a copy in progress. An old copy is freed once its last reader has returned.
+    """
+
+    def __init__(self, interval, commits, pool_size):
+        self.interval = interval
+        self.commits = commits
+        self.pool_size = pool_size
+        self.generation = 0
+        # eligibility_cache.generation when the current copy was taken, stamped on each of its connections
+        self.eligibility_generation = None
+        self._uri = None
+        self._holder = None
+        self._idle = []
+        self._pending_commits = 0
+        self._thread = None
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self):
+        with self._refresh_lock:
+            generation = self.generation + 1
+            uri = f'file:read-replica-{os.getpid()}-{generation}?mode=memory&cache=shared'
+            target = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            eligibility_generation = eligibility_cache.generation
+            with pooled_connection() as source:
+                # Copying in one step reads a single consistent snapshot; under WAL it does not block writers
+                source.backup(target)
+
+            with self._lock:
+                old, idle = self._holder, self._idle
+                self._holder, self._uri, self._idle = target, uri, []
+                self.generation = generation
+                self.eligibility_generation = eligibility_generation
+            for conn in idle:
+                conn.close()
+            if old is not None:
+                old.close()
+
+    def acquire(self):
+        if self._holder is None:
+            self.refresh()
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            uri, generation, eligibility_generation = self._uri, self.generation, self.eligibility_generation
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+            factory=TimedConnection
+        )
+        conn.row_factory = sqlite3.Row
+        conn.replica_generation = generation
+        conn.eligibility_generation = eligibility_generation
+        return conn
+
+    def release(self, conn):
+        with self._lock:
+            if conn.replica_generation == self.generation and len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def note_commit(self):
+        if self.commits > 0:
+            self._pending_commits += 1
+            if self._pending_commits >= self.commits:
+                self._wakeup.set()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='read-replica-refresher', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except sqlite3.Error:
+                app.logger.exception('Read replica refresh failed')
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self._pending_commits = 0
+
+read_replica = ReadReplica(READ_REPLICA_INTERVAL, READ_REPLICA_COMMITS, DB_POOL_SIZE)
+
+def start_read_replica_refresher():
+    if READ_REPLICA:
+        read_replica.start()
+
+def get_read_connection():
+    # Read-only handlers use the in-memory replica when READ_REPLICA is on; writes and the catalog stay on disk
+    if not READ_REPLICA:
+        return get_db_connection()
+    if 'replica' not in g:
+        g.replica = read_replica.acquire()
+    return g.replica
+
+LIST_DEFAULT_LIMIT = 500
+LIST_MAX_LIMIT = 5000
+
+table_columns = {
+    'administrators': ('id', 'username', 'password'),
+    'applicants': ('id', 'name', 'marital_status', 'employment_status', 'sex', 'date_of_birth'),
+    'household_members': ('id', 'applicant_id', 'name', 'employment_status', 'sex', 'date_of_birth', 'relation'),
+    'applications': ('id', 'applicant_id', 'scheme_applied', 'name', 'date_of_birth', 'eligible', 'application_status',
+                     'submitted_at'),
+    'schemes': ('id', 'name'),
+    'criteria': ('id', 'scheme_id', 'scheme_name', 'employment_status', 'children_required', 'school_level'),
+    'benefits': ('id', 'scheme_id', 'scheme_name', 'name', 'amount'),
+}
+
+# Columns each list endpoint may filter on with ?<column>=<value>
+table_filters = {
+    'administrators': ['username'],
+    'applicants': ['employment_status', 'marital_status', 'sex'],
+    'household_members': ['applicant_id', 'relation', 'employment_status', 'sex'],
+    'applications': ['applicant_id', 'scheme_applied', 'eligible', 'application_status'],
+    'schemes': ['name'],
+    'criteria': ['scheme_id', 'employment_status', 'school_level'],
+    'benefits': ['scheme_id', 'name'],
+}
+
+def page_query(table, paged=True):
+    """Builds a keyset-paginated SELECT from the ?after_id=, ?limit=, ?fields= and filter query args.
+
+    Unpaged queries (used for streaming) only apply a LIMIT when ?limit= is given explicitly.
+    """
+    columns = table_columns[table]
+
+    selected = list(columns)
+    if request.args.get('fields'):
+        selected = [field.strip() for field in request.args['fields'].split(',') if field.strip()]
+        unknown = [field for field in selected if field not in columns]
+        if unknown:
+            return None, None, f'Unknown fields {unknown}. Choose from {list(columns)}.'
+        # The cursor for the next page is always the last id
+        if 'id' not in selected:
+            selected.insert(0, 'id')
+
+    try:
+        after_id = int(request.args.get('after_id', 0))
+        limit = request.args.get('limit', LIST_DEFAULT_LIMIT if paged else None)
+        limit = int(limit) if limit is not None else None
+    except ValueError:
+        return None, None, "'after_id' and 'limit' must be integers."
+
+    if paged and not 0 < limit <= LIST_MAX_LIMIT:
+        return None, None, f"'limit' must be between 1 and {LIST_MAX_LIMIT}."
+
+    conditions = ['id > ?']
+    params = [after_id]
+    for field in table_filters[table]:
+        if field in request.args:
+            conditions.append(f'{field} = ?')
+            params.append(request.args[field])
+
+    query = f'''
+        SELECT {', '.join(selected)} FROM {table}
+        WHERE {' AND '.join(conditions)}
+        ORDER BY id
+    '''
+    if limit is not None:
+        query += ' LIMIT ?'
+        params.append(limit)
+    return query, params, None
+
+def fetch_page(table, conn=None):
+    query, params, error = page_query(table)
+    if error:
+        return None, None, error
+
+    rows = (conn or get_db_connection()).execute(query, params).fetchall()
+    next_after_id = rows[-1]['id'] if len(rows) == params[-1] else None
+    return rows, next_after_id, None
+
+STREAM_FETCH_SIZE = 1000
+stream_formats = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+}
+
+def generate_rows(cursor, stream_format):
+    # Encode one fetchmany() batch at a time so memory stays flat regardless of table size
+    if stream_format == 'ndjson':
+        while True:
+            rows = cursor.fetchmany(STREAM_FETCH_SIZE)
+            if not rows:
+                return
+            yield ''.join(json.dumps(dict(row)) + '\n' for row in rows)
+
+    yield '['
+    separator = ''
+    while True:
+        rows = cursor.fetchmany(STREAM_FETCH_SIZE)
+        if not rows:
+            break
+        yield separator + ','.join(json.dumps(dict(row)) for row in rows)
+        separator = ','
+    yield ']'
+
+def stream_table(table, read_only=False):
+    """Streams every matching row of a list endpoint when it is called with ?stream=json or ?stream=ndjson."""
+    stream_format = request.args['stream']
+    if stream_format not in stream_formats:
+        return jsonify({'Error': f"'stream' must be one of {list(stream_formats)}."}), 400
+
+    query, params, error = page_query(table, paged=False)
+    if error:
+        return jsonify({'Error': error}), 400
+
+    # The body is sent after the request's teardown has run, so the stream holds its own connection until it ends
+    pool = read_replica if read_only and READ_REPLICA else db_pool
+    conn = pool.acquire()
+
+    def stream():
+        try:
+            yield from generate_rows(conn.execute(query, params), stream_format)
+        finally:
+            pool.release(conn)
+
+    return Response(stream_with_context(stream()), mimetype=stream_formats[stream_format])
+
+def page_response(rows, next_after_id):
+    response = jsonify([dict(row) for row in rows])
+    if next_after_id is not None:
+        response.headers['X-Next-After-Id'] = str(next_after_id)
+    return response
+
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Metrics:
+    """Request and SQL counters for this server process, rendered in the Prometheus text format."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.connections_opened = 0
+        self.latency = {}       # endpoint -> [count per bucket, sum of seconds, count]
+        self.responses = {}     # (endpoint, method, status) -> count
+        self.sql = {}           # endpoint -> [queries, seconds, connections acquired]
+
+    def request_started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self, endpoint, method, status, seconds):
+        with self._lock:
+            self.in_flight -= 1
+            histogram = self.latency.setdefault(endpoint, [[0] * len(self.buckets), 0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram[0][i] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+            key = (endpoint, method, status)
+            self.responses[key] = self.responses.get(key, 0) + 1
+        self.record_sql(endpoint)
+
+    def record_sql(self, source):
+        # Moves this thread's query_stats into the totals for `source` and starts counting afresh
+        with self._lock:
+            totals = self.sql.setdefault(source, [0, 0.0, 0])
+            totals[0] += query_stats.queries
+            totals[1] += query_stats.seconds
+            totals[2] += query_stats.connections
+        query_stats.reset()
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def render(self):
+        pid = f'pid="{os.getpid()}"'
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for suffix, labels, value in samples:
+                lines.append(f'{name}{suffix}{{{",".join([pid] + labels)}}} {value}')
+
+        with self._lock:
+            metric('app_http_requests_in_flight', 'gauge', 'Requests currently being handled.',
+                   [('', [], self.in_flight)])
+
+            samples = []
+            for endpoint, (bucket_counts, total, count) in sorted(self.latency.items()):
+                label = f'endpoint="{endpoint}"'
+                for bound, bucket_count in zip(self.buckets, bucket_counts):
+                    samples.append(('_bucket', [label, f'le="{bound}"'], bucket_count))
+                samples.append(('_bucket', [label, 'le="+Inf"'], count))
+                samples.append(('_sum', [label], round(total, 6)))
+                samples.append(('_count', [label], count))
+            metric('app_http_request_duration_seconds', 'histogram', 'Time to produce a response, by endpoint.', samples)
+
+            metric('app_http_responses_total', 'counter', 'Responses by endpoint, method and status code.', [
+                ('', [f'endpoint="{endpoint}"', f'method="{method}"', f'status="{status}"'], count)
+                for (endpoint, method, status), count in sorted(self.responses.items())
+            ])
+
+            sql = sorted(self.sql.items())
+            metric('app_sql_queries_total', 'counter', 'SQL statements executed, by endpoint.',
+                   [('', [f'endpoint="{endpoint}"'], totals[0]) for endpoint, totals in sql])
+            metric('app_sql_seconds_total', 'counter', 'Time spent executing and fetching SQL, by endpoint.',
+                   [('', [f'endpoint="{endpoint}"'], round(totals[1], 6)) for endpoint, totals in sql])
+            metric('app_db_connections_acquired_total', 'counter', 'Database connections taken from the pool, by endpoint.',
+                   [('', [f'endpoint="{endpoint}"'], totals[2]) for endpoint, totals in sql])
+            metric('app_db_connections_opened_total', 'counter', 'New SQLite connections opened.',
+                   [('', [], self.connections_opened)])
+            metric('app_db_pool_idle_connections', 'gauge', 'Connections waiting in the pool.',
+                   [('', [], db_pool.idle_count())])
+            metric('app_eligibility_cache_hits_total', 'counter', 'Eligibility lookups answered from the cache.',
+                   [('', [], eligibility_cache.hits)])
+            metric('app_eligibility_cache_misses_total', 'counter', 'Eligibility lookups that were computed.',
+                   [('', [], eligibility_cache.misses)])
+
+        return '\n'.join(lines) + '\n'
+
+metrics = Metrics(METRICS_LATENCY_BUCKETS)
+
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    query_stats.reset()
+    metrics.request_started()
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        metrics.request_finished(request.endpoint or 'unmatched', request.method, response.status_code,
+                                 time.perf_counter() - started)
+    return response
+
+@app.route('/metrics')
+def get_metrics():
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 @app.before_request
 def require_json():
@@ -53,10 +866,199 @@ def require_json():
 def home():
     return "Welcome to Flask with SQLite!"
 
+@app.route('/api/ready')
+def ready():
+    # Readiness probe for the load balancer: the database answers and the scheme catalog is compiled
+    try:
+        conn = get_db_connection()
+        conn.execute('SELECT 1').fetchone()
+        scheme_catalog.rules(conn)
+    except sqlite3.Error as e:
+        return jsonify({'status': 'unavailable', 'error': str(e)}), 503
+    return jsonify({'status': 'ready', 'catalog_version': scheme_catalog.version}), 200
+
 @app.route('/api/data')
 def get_data():
     return jsonify({'message': 'Here is your data!'})
 
+def hash_password(password, rounds):
+    return generate_password_hash(password, rounds).decode('utf-8')
+
+def password_rounds(pw_hash):
+    # bcrypt hashes look like $2b$<rounds>$<salt+digest>
+    try:
+        return int(pw_hash.split('$')[2])
+    except (IndexError, ValueError):
+        return None
+
+class PasswordHasherBusy(Exception):
+    pass
+
+class PasswordHasher:
+    """Runs bcrypt on a small process pool so hashing neither holds the GIL nor blocks request threads."""
+
+    def __init__(self, workers, max_pending, rounds):
+        self.workers = workers
+        self.rounds = rounds
+        self._executor = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def _pool(self):
+        # Created lazily so every pre-forked server worker gets its own pool
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # Forking a threaded server worker can copy a lock some other thread holds, so the
+                    # hashing processes come from a clean forkserver instead
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context('forkserver')
+                    )
+        return self._executor
+
+    def _run(self, fn, *args):
+        if self.workers <= 0:
+            return fn(*args)
+        if not self._slots.acquire(timeout=PASSWORD_HASH_TIMEOUT):
+            raise PasswordHasherBusy()
+        try:
+            return self._pool().submit(fn, *args).result(timeout=PASSWORD_HASH_TIMEOUT)
+        except FutureTimeoutError:
+            raise PasswordHasherBusy()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(hash_password, password, self.rounds)
+
+    def check(self, pw_hash, password):
+        return self._run(check_password_hash, pw_hash, password)
+
+    def needs_rehash(self, pw_hash):
+        return password_rounds(pw_hash) != self.rounds
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+password_hasher = PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING, PASSWORD_HASH_ROUNDS)
+
+@app.errorhandler(PasswordHasherBusy)
+def password_hasher_busy(e):
+    return jsonify({'message': 'Too many login requests. Please try again shortly.'}), 503
+
+class TokenRevocations:
+    """In-memory copy of the token_revocations table, re-read from SQLite at most once per interval."""
+
+    def __init__(self):
+        self._revoked = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self, conn):
+        revoked = dict(conn.execute('SELECT username, revoked_at FROM token_revocations').fetchall())
+        with self._lock:
+            self._revoked = revoked
+            self._checked_at = time.monotonic()
+        return revoked
+
+    def revoked(self, conn):
+        revoked = self._revoked
+        if revoked is None or time.monotonic() - self._checked_at >= TOKEN_REVOCATION_CHECK_INTERVAL:
+            revoked = self.load(conn)
+        return revoked
+
+    def is_revoked(self, conn, username, issued_at):
+        revoked_at = self.revoked(conn).get(username)
+        return revoked_at is not None and issued_at <= revoked_at
+
+    def revoke(self, conn, username):
+        revoked_at = int(time.time())
+        conn.execute('''
+            INSERT INTO token_revocations (username, revoked_at) VALUES (?, ?)
+            ON CONFLICT (username) DO UPDATE SET revoked_at = excluded.revoked_at
+        ''', (username, revoked_at))
+        return revoked_at
+
+token_revocations = TokenRevocations()
+
+class ChangeLog:
+    """Durable, ordered record of every write, read back by GET /api/changes.
+
+    Write units call record() inside their own transaction, so a change is logged exactly when its
+    write commits. Seqs are assigned under SQLite's write lock, so they increase in commit order
+    across every server process.
+    """
+
+    def __init__(self):
+        self.latest = 0
+        self._committed = threading.Condition()
+
+    def record(self, conn, entity, entity_id, operation, data=None):
+        seq = conn.execute(
+            'INSERT INTO changes (entity, entity_id, operation, data) VALUES (?, ?, ?, ?)',
+            (entity, entity_id, operation, json.dumps(data) if data is not None else None)
+        ).lastrowid
+        write_coalescer.after_commit(self.committed, seq)
+        return seq
+
+    def record_many(self, conn, entity, operation, rows):
+        # rows are (entity_id, data) pairs; one executemany keeps bulk imports cheap
+        if not rows:
+            return
+        conn.executemany(
+            'INSERT INTO changes (entity, entity_id, operation, data) VALUES (?, ?, ?, ?)',
+            [(entity, entity_id, operation, json.dumps(data)) for entity_id, data in rows]
+        )
+        seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'changes'").fetchone()[0]
+        write_coalescer.after_commit(self.committed, seq)
+
+    def committed(self, seq):
+        with self._committed:
+            self.latest = max(self.latest, seq)
+            self._committed.notify_all()
+
+    def wait(self, since, timeout):
+        # Wakes early for commits made by this process; other processes' commits are seen on the next poll
+        with self._committed:
+            if self.latest <= since:
+                self._committed.wait(timeout)
+
+    def fetch(self, conn, since, limit):
+        return [
+            {**dict(row), 'data': json.loads(row['data']) if row['data'] is not None else None}
+            for row in conn.execute('SELECT * FROM changes WHERE seq > ? ORDER BY seq LIMIT ?', (since, limit))
+        ]
+
+change_log = ChangeLog()
+
+@app.cli.command('prune-changes')
+@click.option('--keep-days', default=30, show_default=True, help='Keep changes made in this many most recent days.')
+def prune_changes_command(keep_days):
+    """Delete change log entries older than --keep-days."""
+    with pooled_connection() as conn:
+        deleted = conn.execute("DELETE FROM changes WHERE changed_at < datetime('now', ?)", (f'-{keep_days} days',)).rowcount
+        conn.commit()
+    print(f'Deleted {deleted} changes')
+
+def applicant_changes(conn, applicant_ids):
+    """(applicant_id, data) pairs for the change log: each applicant row with its household members."""
+    placeholders = ', '.join('?' * len(applicant_ids))
+    applicants = {
+        row['id']: {**dict(row), 'household': []}
+        for row in conn.execute(f'SELECT * FROM applicants WHERE id IN ({placeholders})', applicant_ids)
+    }
+    for member in conn.execute(f'SELECT * FROM household_members WHERE applicant_id IN ({placeholders}) ORDER BY id', applicant_ids):
+        applicants[member['applicant_id']]['household'].append(dict(member))
+    return list(applicants.items())
+
+@jwt.token_in_blocklist_loader
+def check_if_token_revoked(jwt_header, jwt_payload):
+    identity = jwt_payload.get('sub') or {}
+    return token_revocations.is_revoked(get_db_connection(), identity.get('username'), jwt_payload['iat'])
+
 @app.route('/api/register', methods=['POST'])
 def register():
     data = request.get_json()
@@ -67,15 +1069,16 @@ def register():
     if not username or not password:
         return jsonify({'message': 'Username and password are required'}), 400
 
-    hashed_password = bcrypt.generate_password_hash(password).decode('utf-8')
+    hashed_password = password_hasher.hash(password)
 
-    conn = get_db_connection()
-    try:
+    def insert_administrator(conn):
         conn.execute(
             'INSERT INTO administrators (username, password) VALUES (?, ?)',
             (username, hashed_password)
         )
-        conn.commit()
+
+    try:
+        write_coalescer.execute(insert_administrator)
     except sqlite3.IntegrityError:
         return jsonify({'message': 'User already exists'}), 409
 
@@ -98,74 +1101,77 @@ def login():
     if user is None:
         return jsonify({'message': 'User not found. Please register.'}), 404
 
-    if bcrypt.check_password_hash(user['password'], password):
-        access_token = create_access_token(identity={'username': username, 'role': 'admin'})
+    if password_hasher.check(user['password'], password):
+        if password_hasher.needs_rehash(user['password']):
+            # Only replace the hash we verified, in case the password changed meanwhile
+            write_coalescer.execute(
+                lambda conn, new_hash: conn.execute(
+                    'UPDATE administrators SET password = ? WHERE id = ? AND password = ?',
+                    (new_hash, user['id'], user['password'])
+                ),
+                password_hasher.hash(password)
+            )
+
+        identity = {'username': username, 'role': 'admin'}
 
         return jsonify({
             'message': 'Login successful',
-            'access_token': access_token
+            'access_token': create_access_token(identity=identity),
+            'refresh_token': create_refresh_token(identity=identity)
         }), 200
     else:
         return jsonify({'message': 'Invalid password'}), 401
 
+@app.route('/api/token/refresh', methods=['POST'])
+@jwt_required(refresh=True)
+def refresh_token():
+    # No password check here: the refresh token itself proves the earlier login
+    return jsonify({'access_token': create_access_token(identity=get_jwt_identity())}), 200
+
 @app.route('/api/administrators', methods=['GET'])
 @jwt_required()
 def get_administrators():
-    conn = get_db_connection()
-    administrators = conn.execute('SELECT * FROM administrators').fetchall() 
-    conn.close()
+    administrators, next_after_id, error = fetch_page('administrators')
+    if error:
+        return jsonify({'Error': error}), 400
     if not administrators:
         return jsonify({"message": "No administrators found."}), 404
-    return jsonify([dict(row) for row in administrators]) 
+    return page_response(administrators, next_after_id)
 
 @app.route('/api/administrators/<int:id>', methods=['DELETE'])
 @jwt_required()
 def delete_administrator(id):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    cursor.execute('DELETE FROM administrators WHERE id = ?', (id,))
-    conn.commit()  
-
-    if cursor.rowcount == 0:
-        conn.close()
+    def remove_administrator(conn):
+        administrator = conn.execute('SELECT username FROM administrators WHERE id = ?', (id,)).fetchone()
+        if administrator is None:
+            return None
+        conn.execute('DELETE FROM administrators WHERE id = ?', (id,))
+        token_revocations.revoke(conn, administrator['username'])
+        change_log.record(conn, 'administrator', id, 'delete')
+        return administrator['username']
+
+    if write_coalescer.execute(remove_administrator) is None:
         return jsonify({'message': 'Administrator not found.'}), 404
 
-    conn.close()
+    token_revocations.load(get_db_connection())
+
     return jsonify({'message': 'Administrator deleted successfully.'}), 200
 
 @app.route('/api/applicants', methods=['GET'])
 @jwt_required()
 def get_applicants():
-    conn = get_db_connection()
-    applicants = conn.execute('SELECT * FROM applicants').fetchall() 
-    conn.close()
+    if 'stream' in request.args:
+        return stream_table('applicants', read_only=True)
+
+    applicants, next_after_id, error = fetch_page('applicants', get_read_connection())
+    if error:
+        return jsonify({'Error': error}), 400
     if not applicants:
         return jsonify({"message": "No applicants found."}), 404
 
-    return jsonify([dict(row) for row in applicants]), 200
-
-def validate_household_member(member):
-    if not member.get('name'):
-        return 'Household member must have a name.'
-    
-    if not member.get('employment_status') or member['employment_status'] not in allowed_employment_statuses:
-        return f'Invalid employment status for household member {member.get("name")}.'
-
-    if not member.get('sex') or member['sex'] not in allowed_sexes:
-        return f'Invalid sex for household member {member.get("name")}.'
-    
-    if not member.get('date_of_birth'):
-        return f'Household member {member.get("name")} must have a date of birth.'
-    
-    if not member.get('relation'):
-        return f'Household member {member.get("name")} must have a relation to the applicant.'
-    
-    return None 
-
-def insert_applicant_and_household(applicant_data):
-    conn = get_db_connection()
+    return page_response(applicants, next_after_id), 200
 
+def write_applicant(conn, applicant_data, household):
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -175,21 +1181,21 @@ def insert_applicant_and_household(applicant_data):
     
     applicant_id = cursor.lastrowid
 
-    household = applicant_data.get('household', [])
-    
-    if isinstance(household, list):
-        for member in household:
-            error = validate_household_member(member)
-            if error:
-                return {'Error': error}, 400  
-            conn.execute('''
-                INSERT INTO household_members (applicant_id, name, employment_status, sex, date_of_birth, relation)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (applicant_id, member['name'], member['employment_status'], member['sex'], member['date_of_birth'], member['relation']))
-    else:
-        return {'Error': 'Household must be a list'}, 400
+    conn.executemany('''
+        INSERT INTO household_members (applicant_id, name, employment_status, sex, date_of_birth, relation)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', [
+        (applicant_id, member['name'], member['employment_status'], member['sex'], member['date_of_birth'], member['relation'])
+        for member in household
+    ])
+    update_household_summaries(conn, [applicant_id])
+    change_log.record_many(conn, 'applicant', 'insert', applicant_changes(conn, [applicant_id]))
+    return applicant_id
 
-    conn.commit()
+def insert_applicant_and_household(applicant_data):
+    # Callers validate the whole record, household included, so a bad record never leaves a half-written applicant
+    household = applicant_data.get('household', [])
+    write_coalescer.execute(write_applicant, applicant_data, household)
 
     return {'message': 'Applicant and household members inserted successfully'}, 200
 
@@ -199,63 +1205,105 @@ def insert_applicant_and_household(applicant_data):
 def add_applicant():
     data = request.get_json()
 
-    example_json_to_follow = {
-        "name": "Mary",
-        "employment_status": "unemployed",
-        "sex": "female",
-        "date_of_birth": "1984-10-06",
-        "marital_status" : "married",
-         "household": [
-            {
-            "name": "Gwen",
-            "employment_status": "unemployed",
-            "sex": "female",
-            "date_of_birth": "2016-02-01",
-            "relation": "daughter"
-            },
-            {
-            "name": "Jayden",
-            "employment_status": "unemployed",
-            "sex": "male",
-            "date_of_birth": "2018-03-15",
-            "relation": "son"
-            }
-        ]
-    }
+    errors = applicant_schema.errors(data)
+    if errors:
+        return validation_failed(errors, applicant_example)
 
-    # Validate the main applicant's fields
-    if not data.get('name'):
-        return jsonify({
-            'Error': 'Name is required.',
-            'Example JSON Format': example_json_to_follow
-        }), 400
-
-    if not data.get('employment_status') or data['employment_status'] not in allowed_employment_statuses:
-        return jsonify({
-            'Error': 'Invalid employment status',
-            'Example JSON Format': example_json_to_follow
-        }), 400
-
-    if not data.get('sex') or data['sex'] not in allowed_sexes:
-        return jsonify({
-            'Error': 'Invalid sex',
-            'Example JSON Format': example_json_to_follow
-        }), 400
+    response, status = insert_applicant_and_household(data)
+    return jsonify(response), status
 
-    if not data.get('date_of_birth'):
-        return jsonify({
-            'Error': 'Date of birth is required',
-            'Example JSON Format': example_json_to_follow
-        }), 400
+BULK_BATCH_SIZE = 1000
+BULK_MAX_REPORTED_ERRORS = 1000
+
+def write_applicant_batch(conn, records):
+    # Explicit ids let household rows reference their applicant without a lastrowid per insert;
+    # the writer already holds the write lock, so no other writer can take the same ids
+    next_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM applicants').fetchone()[0] + 1
+    applicant_rows = []
+    member_rows = []
+    for applicant_id, record in enumerate(records, next_id):
+        applicant_rows.append((applicant_id, record['name'], record['marital_status'],
+                               record['employment_status'], record['sex'], record['date_of_birth']))
+        for member in record.get('household', []):
+            member_rows.append((applicant_id, member['name'], member['employment_status'],
+                                member['sex'], member['date_of_birth'], member['relation']))
+
+    conn.executemany('''
+        INSERT INTO applicants (id, name, marital_status, employment_status, sex, date_of_birth)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', applicant_rows)
+    conn.executemany('''
+        INSERT INTO household_members (applicant_id, name, employment_status, sex, date_of_birth, relation)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', member_rows)
+    applicant_ids = [row[0] for row in applicant_rows]
+    update_household_summaries(conn, applicant_ids)
+    change_log.record_many(conn, 'applicant', 'insert', applicant_changes(conn, applicant_ids))
 
-    if not data.get('marital_status') or data['marital_status'] not in allowed_marital_status:
-        return jsonify({
-            'Error': 'Invalid employment status',
-            'Example JSON Format': example_json_to_follow
-        }), 400
+@app.route('/api/applicants/bulk', methods=['POST'])
+@jwt_required()
+def add_applicants_bulk():
+    """Import newline-delimited JSON applicants, one record per line, in bounded batches."""
+    inserted = 0
+    failed = 0
+    errors = []
+    batch = []
+
+    def report(line_number, problems):
+        nonlocal failed
+        failed += 1
+        if len(errors) < BULK_MAX_REPORTED_ERRORS:
+            errors.append({'line': line_number, 'Error': problems[0], 'Errors': problems})
+
+    def flush():
+        nonlocal inserted
+        try:
+            write_coalescer.execute(write_applicant_batch, [record for _, record in batch])
+            inserted += len(batch)
+        except sqlite3.Error:
+            # The failed batch was rolled back whole; retry it record by record so only the
+            # records SQLite rejects are reported, each under its own line number
+            for line_number, record in batch:
+                try:
+                    write_coalescer.execute(write_applicant_batch, [record])
+                    inserted += 1
+                except sqlite3.Error as e:
+                    report(line_number, [f'Could not store the record: {e}'])
+        batch.clear()
+
+    for line_number, line in enumerate(request.stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            report(line_number, [f'Invalid JSON: {e}'])
+            continue
+
+        if not isinstance(record, dict):
+            report(line_number, ['Each line must be a JSON object.'])
+            continue
+
+        problems = applicant_schema.errors(record)
+        if problems:
+            report(line_number, problems)
+            continue
+
+        batch.append((line_number, record))
+        if len(batch) >= BULK_BATCH_SIZE:
+            flush()
+
+    if batch:
+        flush()
 
-    response, status = insert_applicant_and_household(data)
-    return jsonify(response), status
+    return jsonify({
+        'inserted': inserted,
+        'failed': failed,
+        'errors': errors,
+        'errors_truncated': failed > len(errors)
+    }), 200
 
 @app.route('/api/schemes', methods=['GET'])
 @jwt_required()
@@ -264,135 +1312,83 @@ def get_schemes():
     if current_user['role'] != 'admin':
         return jsonify({"msg": "Unauthorized access, admin only"}), 403
     
-    conn = get_db_connection()
-    schemes = conn.execute('SELECT * FROM schemes').fetchall()  
-    conn.close()
-
-    if not schemes:
-        return jsonify({"message": "No schemes found."}), 404
+    return catalog_response('schemes', "No schemes found.")
 
-    return jsonify([dict(row) for row in schemes]), 200
-
-def validate_scheme_input(data):
-    if 'name' not in data or not data['name']:
-        return jsonify({
-            'Error': "'name' is required for the scheme.",
-            'Example JSON Format': scheme_example
-        }), 400
+def write_scheme(conn, data):
+    cursor = conn.cursor()
 
-    if 'criteria' not in data or not isinstance(data['criteria'], dict):
-        return jsonify({
-            'Error': "'criteria' is required and must be an object.",
-            'Example JSON Format': scheme_example
-        }), 400
+    scheme_name = data['name']
 
-    if 'employment_status' not in data['criteria']:
-        return jsonify({
-            'Error': "'employment_status' is required in the criteria.",
-            'Example JSON Format': scheme_example
-        }), 400
+    cursor.execute('''
+        INSERT INTO schemes (name)
+        VALUES (?)
+    ''', (scheme_name,))
+    
+    scheme_id = cursor.lastrowid
 
-    if 'has_children' in data['criteria']:
-        children_criteria = data['criteria']['has_children']
-        if 'school_level' not in children_criteria:
-            return jsonify({
-                'Error': "'school_level' is required when 'has_children' is specified.",
-                'Example JSON Format': scheme_example
-            }), 400
+    criteria = data.get('criteria', {})
+    employment_status = criteria.get('employment_status')
+    children_required = 'has_children' in criteria
+    school_level = criteria.get('has_children', {}).get('school_level', None)
 
-    if 'benefits' not in data or not isinstance(data['benefits'], list):
-        return jsonify({
-            'Error': "'benefits' is required and must be a list.",
-            'Example JSON Format': scheme_example
-        }), 400
+    cursor.execute('''
+        INSERT INTO criteria (scheme_id, scheme_name, employment_status, children_required, school_level)
+        VALUES (?, ?, ?, ?, ?)
+    ''', (scheme_id, scheme_name, employment_status, children_required, school_level))
 
-    for benefit in data['benefits']:
-        if 'name' not in benefit or not benefit['name']:
-            return jsonify({
-                'Error': "Each benefit must have a 'name'.",
-                'Example JSON Format': scheme_example
-            }), 400
+    benefits = data.get('benefits', [])
+    for benefit in benefits:
+        benefit_name = benefit['name']
+        benefit_amount = benefit['amount']
 
-        if 'amount' not in benefit or not isinstance(benefit['amount'], (int, float)):
-            return jsonify({
-                'Error': "Each benefit must have a valid 'amount'.",
-                'Example JSON Format': scheme_example
-            }), 400
+        cursor.execute('''
+            INSERT INTO benefits (scheme_id, scheme_name, name, amount)
+            VALUES (?, ?, ?, ?)
+        ''', (scheme_id, scheme_name, benefit_name, benefit_amount))
 
-    return None  
+    change_log.record(conn, 'scheme', scheme_id, 'insert', {'id': scheme_id, **data})
+    return scheme_id
 
 def insert_scheme_data(data):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     try:
-        scheme_name = data['name']
-
-        cursor.execute('''
-            INSERT INTO schemes (name)
-            VALUES (?)
-        ''', (scheme_name,))
-        
-        scheme_id = cursor.lastrowid
-
-        criteria = data.get('criteria', {})
-        employment_status = criteria.get('employment_status')
-        children_required = 'has_children' in criteria
-        school_level = criteria.get('has_children', {}).get('school_level', None)
-
-        cursor.execute('''
-            INSERT INTO criteria (scheme_id, scheme_name, employment_status, children_required, school_level)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (scheme_id, scheme_name, employment_status, children_required, school_level))
-
-        benefits = data.get('benefits', [])
-        for benefit in benefits:
-            benefit_name = benefit['name']
-            benefit_amount = benefit['amount']
-
-            cursor.execute('''
-                INSERT INTO benefits (scheme_id, scheme_name, name, amount)
-                VALUES (?, ?, ?, ?)
-            ''', (scheme_id, scheme_name, benefit_name, benefit_amount))
-
-        conn.commit()
+        write_coalescer.execute(write_scheme, data)
+        scheme_catalog.load(get_db_connection())
         return {"message": "Scheme added successfully."}, 200
 
     except Exception as e:
-        conn.rollback()
         return {"Error": f"An error occurred: {e}"}, 500
 
-    finally:
-        conn.close()
-
 
 @app.route('/api/add_scheme', methods=['POST'])
 @jwt_required()
 def add_schemes():
     data = request.get_json()
-    validation_error = validate_scheme_input(data)
+    errors = scheme_schema.errors(data)
+    if errors:
+        return validation_failed(errors, scheme_example)
 
-    if validation_error:
-        return validation_error
     result, status_code = insert_scheme_data(data)
     return jsonify(result), status_code
 
 @app.route('/api/delete_scheme/<int:scheme_id>', methods=['DELETE'])
 @jwt_required()
 def delete_scheme(scheme_id):
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    def remove_scheme(conn):
+        cursor = conn.cursor()
 
-    cursor.execute('DELETE FROM benefits WHERE scheme_id = ?', (scheme_id,))
-    
-    cursor.execute('DELETE FROM criteria WHERE scheme_id = ?', (scheme_id,))
-    
-    cursor.execute('DELETE FROM schemes WHERE id = ?', (scheme_id,))
+        cursor.execute('DELETE FROM benefits WHERE scheme_id = ?', (scheme_id,))
+        
+        cursor.execute('DELETE FROM criteria WHERE scheme_id = ?', (scheme_id,))
+        
+        cursor.execute('DELETE FROM schemes WHERE id = ?', (scheme_id,))
+        if cursor.rowcount:
+            change_log.record(conn, 'scheme', scheme_id, 'delete')
+        return cursor.rowcount
 
-    conn.commit()
-    conn.close()
+    deleted = write_coalescer.execute(remove_scheme)
+    scheme_catalog.load(get_db_connection())
 
-    if cursor.rowcount == 0:
+    if deleted == 0:
         return jsonify({"error": "Scheme not found."}), 404
 
     return jsonify({"message": "Scheme and related data deleted successfully."}), 200
@@ -400,107 +1396,433 @@ def delete_scheme(scheme_id):
 @app.route('/api/scheme_benefits', methods=['GET'])
 @jwt_required()
 def get_schemes_benefit():
-    conn = get_db_connection()
-    benefits = conn.execute('SELECT * FROM benefits').fetchall()  
-    conn.close()
-    return jsonify([dict(row) for row in benefits]) 
+    if 'stream' in request.args:
+        return stream_table('benefits')
+
+    return catalog_response('benefits')
 
 @app.route('/api/scheme_criteria', methods=['GET'])
 @jwt_required()
 def get_schemes_criteria():
-    conn = get_db_connection()
-    criteria = conn.execute('SELECT * FROM criteria').fetchall()  
-    conn.close()
-    return jsonify([dict(row) for row in criteria])  
-
-
-def get_eligible_schemes(scheme_id):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    cursor.execute('''
-        SELECT 
-            schemes.name AS scheme_name,
-            benefits.name AS benefit_name,
-            benefits.amount AS benefit_amount
-        FROM schemes
-        JOIN criteria ON schemes.id = criteria.scheme_id
-        JOIN benefits ON schemes.id = benefits.scheme_id
-        WHERE schemes.id = ?
-    ''', (scheme_id,))
-
-    rows = cursor.fetchall()
-
-    conn.close()
-
-    if not rows:
-        return []
-
-    schemes_dict = {}
-
-    for row in rows:
-        scheme_name = row['scheme_name']
-        benefit = f"{row['benefit_name']} (${row['benefit_amount']})"
-
-        if scheme_name not in schemes_dict:
-            schemes_dict[scheme_name] = {
-                "scheme_name": scheme_name,
-                "description": "Financial assistance for retrenched workers",
-                "benefits": []
-            }
-        
-        schemes_dict[scheme_name]["benefits"].append(benefit)
-
-    eligible_schemes = list(schemes_dict.values())
+    return catalog_response('criteria')
+
+
+CHILD_RELATIONS = frozenset(['son', 'daughter'])
+
+# applicant_household_summary column counting the children in each school level's age band.
+# Adding a school level needs a matching column in an init_db.py migration.
+SCHOOL_LEVEL_SUMMARY_COLUMNS = {
+    'primary': 'primary_school_children',
+    'secondary': 'secondary_school_children',
+}
+HOUSEHOLD_SUMMARY_REFRESH_HOUR = int(os.getenv('HOUSEHOLD_SUMMARY_REFRESH_HOUR', '0'))
+
+def rebuild_household_summaries(conn, where='', params=(), current_year=None):
+    """Recomputes applicant_household_summary for the applicants matched by `where` (all by default)."""
+    if current_year is None:
+        current_year = datetime.now().year
+
+    relations = ', '.join(f"'{relation}'" for relation in sorted(CHILD_RELATIONS))
+    child = f'household_members.relation IN ({relations})'
+    age = "(? - CAST(substr(household_members.date_of_birth, 1, 4) AS INTEGER))"
+
+    band_counts = []
+    band_params = []
+    for level in SCHOOL_LEVEL_SUMMARY_COLUMNS:
+        low, high = SCHOOL_LEVEL_AGES[level]
+        band_counts.append(f'COUNT(CASE WHEN {child} AND {age} BETWEEN ? AND ? THEN 1 END)')
+        band_params.extend([current_year, low, high])
+
+    conn.execute(f'''
+        INSERT OR REPLACE INTO applicant_household_summary (
+            applicant_id, child_count, youngest_child_dob, oldest_child_dob, employed_members,
+            {', '.join(SCHOOL_LEVEL_SUMMARY_COLUMNS.values())}, as_of_year
+        )
+        SELECT applicants.id,
+               COUNT(CASE WHEN {child} THEN 1 END),
+               MAX(CASE WHEN {child} THEN household_members.date_of_birth END),
+               MIN(CASE WHEN {child} THEN household_members.date_of_birth END),
+               COUNT(CASE WHEN household_members.employment_status = 'employed' THEN 1 END),
+               {', '.join(band_counts)},
+               ?
+        FROM applicants
+        LEFT JOIN household_members ON household_members.applicant_id = applicants.id
+        {where}
+        GROUP BY applicants.id
+    ''', band_params + [current_year] + list(params))
+
+def update_household_summaries(conn, applicant_ids, current_year=None):
+    # Every applicant and household write goes through here, which makes it the place to drop cached eligibility
+    for chunk in chunked(applicant_ids, BATCH_CHUNK_SIZE):
+        placeholders = ', '.join('?' * len(chunk))
+        rebuild_household_summaries(conn, f'WHERE applicants.id IN ({placeholders})', chunk, current_year)
+    write_coalescer.after_commit(eligibility_cache.invalidate, applicant_ids)
+
+def refresh_household_summaries(conn, current_year=None):
+    # Ages are whole calendar years, so only rows computed in an earlier year can have changed bands
+    if current_year is None:
+        current_year = datetime.now().year
+    rebuild_household_summaries(conn, '''
+        WHERE applicants.id IN (SELECT applicant_id FROM applicant_household_summary WHERE as_of_year < ?)
+    ''', (current_year,), current_year)
+    write_coalescer.after_commit(eligibility_cache.clear)
+
+def load_household_summaries(conn, applicant_ids):
+    """Returns applicant_id -> summary row, first rebuilding any row that is missing or out of date."""
+    current_year = datetime.now().year
 
-    return eligible_schemes
+    def select(conn, ids):
+        rows = {}
+        for chunk in chunked(ids, BATCH_CHUNK_SIZE):
+            placeholders = ', '.join('?' * len(chunk))
+            for row in conn.execute(
+                f'SELECT * FROM applicant_household_summary WHERE applicant_id IN ({placeholders})', chunk
+            ):
+                rows[row['applicant_id']] = row
+        return rows
+
+    def rebuild(write_conn, ids):
+        # Read the rows back on the writer's connection: `conn` may be a replica that cannot see them yet
+        update_household_summaries(write_conn, ids, current_year)
+        return select(write_conn, ids)
+
+    summaries = select(conn, applicant_ids)
+    stale = [
+        applicant_id for applicant_id in applicant_ids
+        if applicant_id not in summaries or summaries[applicant_id]['as_of_year'] != current_year
+    ]
+    if stale:
+        summaries.update(write_coalescer.execute(rebuild, stale))
+    return summaries
+
+def start_household_summary_refresher():
+    """Refreshes summaries once a day so children who age into or out of a school band are picked up."""
+    def run():
+        while True:
+            now = datetime.now()
+            next_run = now.replace(hour=HOUSEHOLD_SUMMARY_REFRESH_HOUR, minute=0, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            time.sleep((next_run - now).total_seconds())
+            try:
+                write_coalescer.execute(refresh_household_summaries)
+            except sqlite3.Error:
+                app.logger.exception('Household summary refresh failed')
+
+    thread = threading.Thread(target=run, name='household-summary-refresher', daemon=True)
+    thread.start()
+    return thread
+
+@app.cli.command('rebuild-household-summaries')
+def rebuild_household_summaries_command():
+    """Recompute the household summary of every applicant."""
+    with pooled_connection() as conn:
+        rebuild_household_summaries(conn)
+        conn.commit()
+        count = conn.execute('SELECT COUNT(*) FROM applicant_household_summary').fetchone()[0]
+    print(f'Rebuilt {count} household summaries')
+
+@app.cli.command('refresh-household-summaries')
+def refresh_household_summaries_command():
+    """Recompute household summaries last computed in an earlier year."""
+    with pooled_connection() as conn:
+        refresh_household_summaries(conn)
+        conn.commit()
 
+class SchemeRule:
+    """A scheme's criteria and benefits compiled into a predicate over an applicant."""
+
+    __slots__ = ('scheme_id', 'scheme_name', 'employment_status', 'children_required',
+                 'school_level', 'summary_column', 'benefit_total', 'result')
+
+    def __init__(self, scheme_id, scheme_name, employment_status, children_required, school_level, benefits):
+        self.scheme_id = scheme_id
+        self.scheme_name = scheme_name
+        self.employment_status = employment_status
+        self.children_required = bool(children_required)
+        self.school_level = school_level
+        # No school level only requires children; a level without a summary column (stored before
+        # levels were validated) matches no one rather than every parent
+        self.summary_column = SCHOOL_LEVEL_SUMMARY_COLUMNS.get(school_level) if school_level else 'child_count'
+        self.benefit_total = sum(amount or 0 for name, amount in benefits)
+        self.result = {
+            "scheme_name": scheme_name,
+            "description": self.describe(),
+            "benefits": [f"{name} (${amount})" for name, amount in benefits]
+        }
 
-def which_scheme(applicant_id):
+    def describe(self):
+        description = "Financial assistance"
+        if self.employment_status:
+            description += f" for {self.employment_status} applicants"
+        if self.children_required:
+            level = f"{self.school_level} school " if self.school_level else ""
+            description += f" with {level}children"
+        return description
+
+    def matches(self, employment_status, summary):
+        if self.employment_status and employment_status != self.employment_status:
+            return False
+        if not self.children_required:
+            return True
+        return self.summary_column is not None and summary[self.summary_column] > 0
+
+CATALOG_VERSION_CHECK_INTERVAL = float(os.getenv('CATALOG_VERSION_CHECK_INTERVAL', '1.0'))
+CATALOG_MAX_AGE = int(os.getenv('CATALOG_MAX_AGE', '0'))
+CATALOG_CACHE_MAX_ENTRIES = 256
+
+def catalog_db_version(conn):
+    return conn.execute('SELECT version FROM catalog_version WHERE id = 1').fetchone()[0]
+
+class SchemeCatalog:
+    """In-memory compiled view of the schemes, criteria and benefits tables.
+
+    Also holds pre-serialized catalog responses. Both are tagged with the catalog_version row,
+    which triggers bump on every catalog write, and are rebuilt when it changes.
+    """
+
+    def __init__(self):
+        self.version = None
+        self._rules = None
+        self._responses = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self, conn):
+        # Read the version first: a write racing with the load leaves us stale, never falsely current
+        version = catalog_db_version(conn)
+
+        benefits = {}
+        for row in conn.execute('SELECT scheme_id, name, amount FROM benefits ORDER BY id'):
+            benefits.setdefault(int(row['scheme_id']), []).append((row['name'], row['amount']))
+
+        rules = tuple(
+            SchemeRule(
+                row['scheme_id'],
+                row['scheme_name'],
+                row['employment_status'],
+                row['children_required'],
+                row['school_level'],
+                benefits.get(row['scheme_id'], [])
+            )
+            for row in conn.execute('''
+                SELECT schemes.id AS scheme_id, schemes.name AS scheme_name,
+                       criteria.employment_status, criteria.children_required, criteria.school_level
+                FROM schemes
+                JOIN criteria ON schemes.id = criteria.scheme_id
+                ORDER BY schemes.id
+            ''')
+        )
+        # Swap the whole tuple in one assignment so readers never see a partial catalog
+        with self._lock:
+            self.version = version
+            self._rules = rules
+            self._responses = {}
+            self._checked_at = time.monotonic()
+        return rules
+
+    def refresh(self, conn):
+        # Other processes change the catalog too, so poll its version at most once per interval
+        if self._rules is None:
+            self.load(conn)
+            return
+        now = time.monotonic()
+        if now - self._checked_at < CATALOG_VERSION_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        if catalog_db_version(conn) != self.version:
+            self.load(conn)
+
+    def is_fresh(self):
+        # True while `version` is recent enough that refresh() would not query SQLite
+        return self._rules is not None and time.monotonic() - self._checked_at < CATALOG_VERSION_CHECK_INTERVAL
+
+    def rules(self, conn):
+        self.refresh(conn)
+        return self._rules
+
+    def cached_response(self, conn, key):
+        self.refresh(conn)
+        return self._responses.get(key)
+
+    def store_response(self, key, entry):
+        with self._lock:
+            # Drop entries built against a catalog that has since been replaced
+            if entry['version'] != self.version:
+                return
+            if len(self._responses) >= CATALOG_CACHE_MAX_ENTRIES:
+                self._responses = {}
+            self._responses[key] = entry
+
+    def evaluate(self, conn, employment_status, summary):
+        return [rule.result for rule in self.rules(conn) if rule.matches(employment_status, summary)]
+
+scheme_catalog = SchemeCatalog()
+
+def catalog_response(table, empty_message=None):
+    """Serves a catalog list endpoint from pre-serialized bodies, answering If-None-Match with 304."""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT * FROM household_members 
-        WHERE applicant_id = ? AND (relation = "son" OR relation = "daughter")
-    ''', (applicant_id,))
-
-    current_year = datetime.now().year
-
-    cursor.execute('''
-        SELECT * FROM household_members 
-        WHERE applicant_id = ? 
-        AND (relation = "son" OR relation = "daughter")
-        AND (? - strftime('%Y', date_of_birth)) BETWEEN 7 AND 12
-    ''', (applicant_id, current_year))
+    key = request.full_path
+
+    entry = scheme_catalog.cached_response(conn, key)
+    if entry is None:
+        version = scheme_catalog.version
+        rows, next_after_id, error = fetch_page(table)
+        if error:
+            return jsonify({'Error': error}), 400
+
+        if not rows and empty_message:
+            body, status = json.dumps({"message": empty_message}), 404
+        else:
+            body, status = json.dumps([dict(row) for row in rows]), 200
+        body = body.encode('utf-8')
+
+        entry = {
+            'version': version,
+            'body': body,
+            'status': status,
+            'etag': f'{version}-{hashlib.sha1(body).hexdigest()[:16]}',
+            'next_after_id': next_after_id
+        }
+        scheme_catalog.store_response(key, entry)
 
-    household = cursor.fetchall()
+    headers = {
+        'ETag': f'"{entry["etag"]}"',
+        'Cache-Control': f'private, max-age={CATALOG_MAX_AGE}, must-revalidate'
+    }
+    if entry['next_after_id'] is not None:
+        headers['X-Next-After-Id'] = str(entry['next_after_id'])
+
+    if entry['status'] == 200 and entry['etag'] in request.if_none_match:
+        return Response(status=304, headers=headers)
+    return Response(entry['body'], status=entry['status'], headers=headers, mimetype='application/json')
+
+ELIGIBILITY_CACHE_MAX_ENTRIES = int(os.getenv('ELIGIBILITY_CACHE_MAX_ENTRIES', '10000'))
+ELIGIBILITY_CACHE_TTL = float(os.getenv('ELIGIBILITY_CACHE_TTL', '300'))
+
+class EligibilityCache:
+    """LRU of serialized /api/schemes/eligible responses keyed by applicant id.
+
+    Entries are tagged with the catalog version they were computed against, dropped when the
+    applicant's household summary is rewritten in this process, and expire after the TTL (which
+    bounds staleness from writes made by other processes) or when school-level bands next move.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # Bumped on every invalidation, so a result computed across one is not stored
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, applicant_id, catalog_version):
+        with self._lock:
+            entry = self._entries.get(applicant_id)
+            if entry is None or entry[0] != catalog_version or entry[1] <= time.time():
+                if entry is not None:
+                    del self._entries[applicant_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(applicant_id)
+            self.hits += 1
+            return entry[2], entry[3]
+
+    def put(self, applicant_id, generation, catalog_version, body, status, expires_at):
+        with self._lock:
+            if self.max_entries <= 0 or generation != self.generation:
+                return
+            self._entries[applicant_id] = (catalog_version, min(expires_at, time.time() + self.ttl), body, status)
+            self._entries.move_to_end(applicant_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, applicant_ids):
+        with self._lock:
+            self.generation += 1
+            for applicant_id in applicant_ids:
+                self._entries.pop(applicant_id, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+eligibility_cache = EligibilityCache(ELIGIBILITY_CACHE_MAX_ENTRIES, ELIGIBILITY_CACHE_TTL)
+
+def next_age_band_change():
+    # Ages are whole calendar years (see rebuild_household_summaries), so bands only move on 1 January
+    return datetime(datetime.now().year + 1, 1, 1).timestamp()
+
+def applicant_eligibility(applicant):
+    # Every scheme requires an unemployed applicant, so this gate runs before any household rules
+    if not applicant:
+        return {'error': 'Applicant not found', 'result': False}, 404
 
-    if not household:
-        eligible_schemes = get_eligible_schemes(1)
-    else:
-        eligible_schemes = get_eligible_schemes(2)
+    if applicant['employment_status'] != 'unemployed':
+        return {'error': 'Applicant is not unemployed and is not eligible for schemes.', 'result': False}, 400
 
-    conn.close()
-    return {
-        'applicant_id': applicant_id,
-        'eligible_schemes': eligible_schemes
-    }, 200
+    return {'result': True}, 200
 
-def eligibility(applicant_id):
+def eligibility(applicant_id, conn=None):
 
-    conn = get_db_connection()
+    if conn is None:
+        conn = get_db_connection()
     cursor = conn.cursor()
 
     cursor.execute('SELECT * FROM applicants WHERE id = ?', (applicant_id,))
-    applicant = cursor.fetchone()
+    return applicant_eligibility(cursor.fetchone())
+
+def catalog_rules(conn):
+    # The catalog version is always polled on disk, so a lagging replica never rolls the catalog back
+    rules = scheme_catalog.rules(conn)
+    return scheme_catalog.version, rules
+
+def read_eligibility_inputs(conn, applicant_id):
+    """Returns (cache generation, applicant row, household summary) for one applicant, read on `conn`."""
+    generation = eligibility_cache.generation
+    if READ_REPLICA:
+        # Taken from the copy `conn` reads: one from before the latest invalidation may predate that write,
+        # so its result is not cached. read_replica.eligibility_generation may already belong to a newer copy.
+        generation = conn.eligibility_generation
+    applicant = conn.execute('SELECT id, employment_status FROM applicants WHERE id = ?', (applicant_id,)).fetchone()
+    summary = None
+    if applicant_eligibility(applicant)[0]['result']:
+        summary = load_household_summaries(conn, [applicant_id])[applicant_id]
+    return generation, applicant, summary
+
+def eligibility_response(applicant_id, applicant, summary, rules, generation, catalog_version):
+    """Builds and caches the GET /api/schemes/eligible response; returns (JSON body, status code).
+
+    Shared by the Flask view and the ASGI handler in asgi.py, so both serve byte-identical responses.
+    """
+    result, status_code = applicant_eligibility(applicant)
+    # Ineligible employment status does not depend on age; unknown applicants may be added later
+    expires_at = float('inf')
+    if result['result']:
+        result = {
+            'applicant_id': str(applicant_id),
+            'eligible_schemes': [rule.result for rule in rules if rule.matches(applicant['employment_status'], summary)]
+        }
+        expires_at = next_age_band_change()
 
-    if not applicant:
-        return {'error': 'Applicant not found', 'result': False}, 404
+    with app.app_context():
+        body = app.json.response(result).get_data()
+    if status_code != 404:
+        eligibility_cache.put(applicant_id, generation, catalog_version, body, status_code, expires_at)
+    return body, status_code
 
-    if applicant['employment_status'] != 'unemployed':
-        return {'error': 'Applicant is not unemployed and is not eligible for schemes.', 'result': False}, 400
+# Largest value SQLite can store in an INTEGER column; binding anything larger raises OverflowError
+SQLITE_MAX_INTEGER = 2 ** 63 - 1
 
-    return {'result': True}, 200
+def parse_applicant_id(value):
+    # ASCII digits only: SQLite would also match '1.0' or ' 1' to applicant 1, and int() rejects '²'
+    if not re.fullmatch(r'[0-9]+', value):
+        return None
+    applicant_id = int(value)
+    return applicant_id if applicant_id <= SQLITE_MAX_INTEGER else None
 
 @app.route('/api/schemes/eligible', methods=['GET'])
 @jwt_required()
@@ -514,26 +1836,400 @@ def get_specific_scheme():
     if not applicant_id:
         return jsonify({'error': 'Applicant ID is required'}), 400
 
-    result, status_code = eligibility(applicant_id)
-    if result['result']:
-        return which_scheme(applicant_id)
-    else:
-        return jsonify(result), status_code
+    # One spelling per id, so '007' and '7' share a cache entry and the same response
+    applicant_id = parse_applicant_id(applicant_id)
+    if applicant_id is None:
+        return jsonify({'error': 'Applicant not found', 'result': False}), 404
+    scheme_catalog.refresh(get_db_connection())
+    cached = eligibility_cache.get(applicant_id, scheme_catalog.version)
+    if cached is None:
+        generation, applicant, summary = read_eligibility_inputs(get_read_connection(), applicant_id)
+        catalog_version, rules = catalog_rules(get_db_connection())
+        cached = eligibility_response(applicant_id, applicant, summary, rules, generation, catalog_version)
+    body, status_code = cached
+    return Response(body, status=status_code, mimetype='application/json')
+
+BATCH_CHUNK_SIZE = 500
+BATCH_MAX_LIMIT = 5000
+batch_filter_fields = ['employment_status', 'marital_status', 'sex']
+
+def is_integer(value):
+    # JSON true/false arrive as bool, which is a subclass of int; larger ints than SQLite stores cannot be bound
+    return isinstance(value, int) and not isinstance(value, bool) and -SQLITE_MAX_INTEGER - 1 <= value <= SQLITE_MAX_INTEGER
+
+def chunked(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def fetch_applicants_by_id(conn, applicant_ids):
+    applicants = []
+    for chunk in chunked(applicant_ids, BATCH_CHUNK_SIZE):
+        placeholders = ', '.join('?' * len(chunk))
+        applicants.extend(conn.execute(
+            f'SELECT id, employment_status FROM applicants WHERE id IN ({placeholders})', chunk
+        ).fetchall())
+    return applicants
+
+def batch_eligibility(conn, applicants, missing_ids=()):
+    summaries = load_household_summaries(conn, [applicant['id'] for applicant in applicants])
+
+    results = []
+    for applicant in applicants:
+        if applicant['employment_status'] != 'unemployed':
+            results.append({
+                'applicant_id': applicant['id'],
+                'error': 'Applicant is not unemployed and is not eligible for schemes.'
+            })
+            continue
+        results.append({
+            'applicant_id': applicant['id'],
+            'eligible_schemes': scheme_catalog.evaluate(
+                get_db_connection(), applicant['employment_status'], summaries[applicant['id']]
+            )
+        })
+    for applicant_id in missing_ids:
+        results.append({'applicant_id': applicant_id, 'error': 'Applicant not found'})
+    return results
+
+@app.route('/api/schemes/eligible/batch', methods=['POST'])
+@jwt_required()
+def get_batch_schemes():
+    current_user = get_jwt_identity()  # Get the user info from the JWT token
+    if current_user['role'] != 'admin':
+        return jsonify({"msg": "Unauthorized access, admin only"}), 403
 
+    data = request.get_json()
+
+    example_json = {
+        "filter": {"employment_status": "unemployed"},
+        "after_id": 0,
+        "limit": 1000
+    }
+
+    if not isinstance(data, dict):
+        return jsonify({
+            'Error': 'Request body must be a JSON object.',
+            'Example JSON Format': example_json
+        }), 400
+
+    conn = get_read_connection()
+
+    if 'applicant_ids' in data:
+        applicant_ids = data['applicant_ids']
+        if not isinstance(applicant_ids, list) or not all(is_integer(i) for i in applicant_ids):
+            return jsonify({
+                'Error': "'applicant_ids' must be a list of integers.",
+                'Example JSON Format': {"applicant_ids": [1, 2, 3]}
+            }), 400
+        if len(applicant_ids) > BATCH_MAX_LIMIT:
+            return jsonify({'Error': f'At most {BATCH_MAX_LIMIT} applicant IDs can be checked per request.'}), 400
+
+        applicant_ids = sorted(set(applicant_ids))
+        applicants = fetch_applicants_by_id(conn, applicant_ids)
+        found = {applicant['id'] for applicant in applicants}
+        missing = [applicant_id for applicant_id in applicant_ids if applicant_id not in found]
+        return jsonify({'results': batch_eligibility(conn, applicants, missing), 'next_after_id': None}), 200
+
+    filters = data.get('filter', {})
+    after_id = data.get('after_id', 0)
+    limit = data.get('limit', 1000)
+
+    if not isinstance(filters, dict) or any(key not in batch_filter_fields for key in filters):
+        return jsonify({
+            'Error': f"'filter' may only contain {batch_filter_fields}.",
+            'Example JSON Format': example_json
+        }), 400
+
+    if not all(isinstance(value, str) or is_integer(value) for value in filters.values()):
+        return jsonify({
+            'Error': "'filter' values must be strings or integers.",
+            'Example JSON Format': example_json
+        }), 400
+
+    if not is_integer(after_id) or not is_integer(limit) or not 0 < limit <= BATCH_MAX_LIMIT:
+        return jsonify({
+            'Error': f"'after_id' must be an integer and 'limit' between 1 and {BATCH_MAX_LIMIT}.",
+            'Example JSON Format': example_json
+        }), 400
+
+    query = 'SELECT id, employment_status FROM applicants WHERE id > ?'
+    params = [after_id]
+    for field, value in filters.items():
+        query += f' AND {field} = ?'
+        params.append(value)
+    query += ' ORDER BY id LIMIT ?'
+    params.append(limit)
+
+    applicants = conn.execute(query, params).fetchall()
+    next_after_id = applicants[-1]['id'] if len(applicants) == limit else None
+
+    return jsonify({'results': batch_eligibility(conn, applicants), 'next_after_id': next_after_id}), 200
+
+POPULATION_SNAPSHOT_INTERVAL = float(os.getenv('POPULATION_SNAPSHOT_INTERVAL', '300'))
+
+class PopulationSnapshot:
+    """Column arrays over every applicant, used to evaluate scheme rules for the whole population at once.
+
+    `columns` uses the applicant_household_summary column names, so SchemeRule.summary_column
+    indexes it directly.
+    """
+
+    def __init__(self, conn):
+        self.as_of_year = datetime.now().year
+        self.built_at = time.time()
+
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute('BEGIN')
+        try:
+            applicants = cursor.execute('SELECT id, employment_status FROM applicants ORDER BY id').fetchall()
+            relations = ', '.join('?' * len(CHILD_RELATIONS))
+            children = cursor.execute(f'''
+                SELECT applicant_id, CAST(substr(date_of_birth, 1, 4) AS INTEGER)
+                FROM household_members WHERE relation IN ({relations})
+            ''', sorted(CHILD_RELATIONS)).fetchall()
+        finally:
+            conn.rollback()
+
+        self.ids = np.array([row[0] for row in applicants], dtype=np.int64)
+        self.employment_statuses = tuple(sorted({row[1] for row in applicants}))
+        codes = {status: code for code, status in enumerate(self.employment_statuses)}
+        self.employment = np.array([codes[row[1]] for row in applicants], dtype=np.int16)
+
+        child_owner = np.array([row[0] for row in children], dtype=np.int64)
+        child_ages = self.as_of_year - np.array([row[1] for row in children], dtype=np.int32)
+        # Map each child to its applicant's position, dropping members whose applicant is gone
+        index = np.searchsorted(self.ids, child_owner)
+        known = index < len(self.ids)
+        known[known] = self.ids[index[known]] == child_owner[known]
+        index, child_ages = index[known], child_ages[known]
+
+        self.columns = {'child_count': np.bincount(index, minlength=len(self.ids))}
+        for level, column in SCHOOL_LEVEL_SUMMARY_COLUMNS.items():
+            low, high = SCHOOL_LEVEL_AGES[level]
+            in_band = (child_ages >= low) & (child_ages <= high)
+            self.columns[column] = np.bincount(index[in_band], minlength=len(self.ids))
+
+    def with_employment_status(self, status):
+        if status not in self.employment_statuses:
+            return np.zeros(len(self.ids), dtype=bool)
+        return self.employment == self.employment_statuses.index(status)
+
+    def eligible(self, rule):
+        # Same gate as eligibility(): only unemployed applicants qualify for any scheme
+        mask = self.with_employment_status('unemployed')
+        if rule.employment_status:
+            mask &= self.with_employment_status(rule.employment_status)
+        if rule.children_required:
+            if rule.summary_column is None:
+                return np.zeros(len(self.ids), dtype=bool)
+            mask &= self.columns[rule.summary_column] > 0
+        return mask
+
+    def report(self, rules, catalog_version):
+        eligible_any = np.zeros(len(self.ids), dtype=bool)
+        payouts = np.zeros(len(self.ids), dtype=np.float64)
+        schemes = []
+        for rule in rules:
+            mask = self.eligible(rule)
+            eligible_any |= mask
+            payouts += mask * rule.benefit_total
+            count = int(np.count_nonzero(mask))
+            schemes.append({
+                'scheme_id': rule.scheme_id,
+                'scheme_name': rule.scheme_name,
+                'eligible_applicants': count,
+                'payout_per_applicant': rule.benefit_total,
+                'total_payout': round(count * rule.benefit_total, 2)
+            })
+
+        return {
+            'applicants': len(self.ids),
+            'eligible_for_any_scheme': int(np.count_nonzero(eligible_any)),
+            'total_payout': round(float(payouts.sum()), 2),
+            'schemes': schemes,
+            'as_of_year': self.as_of_year,
+            'catalog_version': catalog_version,
+            'snapshot_built_at': datetime.fromtimestamp(self.built_at).isoformat(timespec='seconds')
+        }
+
+class PopulationAnalytics:
+    """Holds the current PopulationSnapshot and the report computed from it for each catalog version."""
+
+    def __init__(self):
+        self._snapshot = None
+        self._report = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self):
+        return self._snapshot is not None
+
+    def rebuild(self, conn):
+        snapshot = PopulationSnapshot(conn)
+        with self._lock:
+            self._snapshot = snapshot
+            self._report = None
+        return snapshot
+
+    def report(self, conn):
+        rules = scheme_catalog.rules(conn)
+        version = scheme_catalog.version
+        with self._lock:
+            snapshot, cached = self._snapshot, self._report
+        if snapshot is None:
+            snapshot = self.rebuild(conn)
+        if cached is not None and cached[0] is snapshot and cached[1] == version:
+            return cached[2]
+
+        report = snapshot.report(rules, version)
+        with self._lock:
+            if self._snapshot is snapshot:
+                self._report = (snapshot, version, report)
+        return report
+
+population_analytics = PopulationAnalytics()
+
+def start_population_snapshot_refresher():
+    """Rebuilds the population snapshot every POPULATION_SNAPSHOT_INTERVAL seconds once it has been requested."""
+    def run():
+        while True:
+            time.sleep(POPULATION_SNAPSHOT_INTERVAL)
+            # The first /api/schemes/population call builds it, so unused workers never load the population
+            if not population_analytics.built:
+                continue
+            try:
+                with pooled_connection() as conn:
+                    population_analytics.rebuild(conn)
+            except sqlite3.Error:
+                app.logger.exception('Population snapshot rebuild failed')
+
+    thread = threading.Thread(target=run, name='population-snapshot-refresher', daemon=True)
+    thread.start()
+    return thread
+
+@app.route('/api/schemes/population', methods=['GET'])
+@jwt_required()
+def get_population_report():
+    current_user = get_jwt_identity()  # Get the user info from the JWT token
+    if current_user['role'] != 'admin':
+        return jsonify({"msg": "Unauthorized access, admin only"}), 403
+
+    return jsonify(population_analytics.report(get_db_connection())), 200
 
 @app.route('/api/applications', methods=['GET'])
 @jwt_required()
 def get_applications():
-    conn = get_db_connection()
-    applications = conn.execute('SELECT * FROM applications').fetchall()  
-    conn.close()
+    if 'stream' in request.args:
+        return stream_table('applications')
+
+    applications, next_after_id, error = fetch_page('applications')
+    if error:
+        return jsonify({'Error': error}), 400
     if not applications:
         return jsonify({"message": "No applications found."}), 404
 
-    return jsonify([dict(row) for row in applications]) 
+    return page_response(applications, next_after_id)
 
-def insert_application(application_data):
-    conn = get_db_connection()
+export_formats = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+def export_query():
+    """Builds the export SELECT from ?from_id=, ?to_id=, ?from_date=, ?to_date= and the list endpoint's filters."""
+    columns = table_columns['applications']
+    conditions = []
+    params = []
+
+    try:
+        for arg, condition in (('from_id', 'id >= ?'), ('to_id', 'id <= ?')):
+            if arg in request.args:
+                conditions.append(condition)
+                params.append(int(request.args[arg]))
+    except ValueError:
+        return None, None, "'from_id' and 'to_id' must be integers."
+
+    # Dates are inclusive; submitted_at is stored as 'YYYY-MM-DD HH:MM:SS', so text comparison orders it correctly
+    try:
+        if 'from_date' in request.args:
+            conditions.append('submitted_at >= ?')
+            params.append(datetime.strptime(request.args['from_date'], '%Y-%m-%d').date().isoformat())
+        if 'to_date' in request.args:
+            conditions.append('submitted_at < ?')
+            params.append((datetime.strptime(request.args['to_date'], '%Y-%m-%d').date() + timedelta(days=1)).isoformat())
+    except ValueError:
+        return None, None, "'from_date' and 'to_date' must be dates in YYYY-MM-DD format."
+
+    for field in table_filters['applications']:
+        if field in request.args:
+            conditions.append(f'{field} = ?')
+            params.append(request.args[field])
+
+    query = f"SELECT {', '.join(columns)} FROM applications"
+    if conditions:
+        query += f" WHERE {' AND '.join(conditions)}"
+    return query + ' ORDER BY id', params, None
+
+def generate_csv(cursor):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(table_columns['applications'])
+    while True:
+        rows = cursor.fetchmany(STREAM_FETCH_SIZE)
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        if not rows:
+            return
+        buffer.seek(0)
+        buffer.truncate()
+
+def gzip_chunks(chunks):
+    # Compresses each chunk as it is produced, so the whole body never sits in memory
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+@app.route('/api/applications/export', methods=['GET'])
+@jwt_required()
+def export_applications():
+    current_user = get_jwt_identity()  # Get the user info from the JWT token
+    if current_user['role'] != 'admin':
+        return jsonify({"msg": "Unauthorized access, admin only"}), 403
+
+    export_format = request.args.get('format', 'csv')
+    if export_format not in export_formats:
+        return jsonify({'Error': f"'format' must be one of {list(export_formats)}."}), 400
+
+    query, params, error = export_query()
+    if error:
+        return jsonify({'Error': error}), 400
+
+    # Like stream_table, the export holds its own connection until the last row is sent
+    pool = read_replica if READ_REPLICA else db_pool
+    conn = pool.acquire()
+    compress = 'gzip' in request.accept_encodings
+
+    def export():
+        try:
+            cursor = conn.execute(query, params)
+            chunks = generate_csv(cursor) if export_format == 'csv' else generate_rows(cursor, 'ndjson')
+            yield from gzip_chunks(chunks) if compress else chunks
+        finally:
+            pool.release(conn)
+
+    response = Response(stream_with_context(export()), mimetype=export_formats[export_format])
+    response.headers['Content-Disposition'] = f'attachment; filename=applications.{export_format}'
+    response.headers['Vary'] = 'Accept-Encoding'
+    if compress:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+def record_application(conn, application_data):
+    """Decides and inserts one application without committing, so callers can group several writes."""
     cursor = conn.cursor()
 
     cursor.execute('''
@@ -547,7 +2243,7 @@ def insert_application(application_data):
 
     applicant_id = applicant[0]
 
-    result, status_code = eligibility(applicant_id)
+    result, status_code = eligibility(applicant_id, conn)
     if result['result']:
         eligible_yes_no = 'yes'
         application_status = 'approved'
@@ -556,8 +2252,8 @@ def insert_application(application_data):
         application_status = 'denied'
 
     cursor.execute('''
-        INSERT INTO applications (applicant_id, scheme_applied, name, date_of_birth, eligible, application_status)
-        VALUES (?, ?, ?, ?, ?, ?)
+        INSERT INTO applications (applicant_id, scheme_applied, name, date_of_birth, eligible, application_status, submitted_at)
+        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
     ''', (
         applicant_id,
         application_data['scheme_applied'],
@@ -567,10 +2263,114 @@ def insert_application(application_data):
         application_status
     ))
 
-    conn.commit()
-    conn.close()
+    application_id = cursor.lastrowid
+    application = conn.execute('SELECT * FROM applications WHERE id = ?', (application_id,)).fetchone()
+    change_log.record(conn, 'application', application_id, 'insert', dict(application))
+    return {'message': 'Application inserted successfully', 'application_id': application_id}, 200
 
-    return {'message': 'Application inserted successfully'}, 200
+def insert_application(application_data):
+    result, status_code = write_coalescer.execute(record_application, application_data)
+    if status_code == 200:
+        del result['application_id']
+    return result, status_code
+
+APPLICATION_JOB_BATCH_SIZE = int(os.getenv('APPLICATION_JOB_BATCH_SIZE', '100'))
+APPLICATION_JOB_POLL_INTERVAL = float(os.getenv('APPLICATION_JOB_POLL_INTERVAL', '1.0'))
+
+def decide_queued_applications(conn):
+    # Runs as one write unit, so concurrent workers never claim the same job
+    # and a crash simply leaves the batch 'queued'
+    jobs = conn.execute(
+        "SELECT id, payload FROM application_jobs WHERE status = 'queued' ORDER BY id LIMIT ?",
+        (APPLICATION_JOB_BATCH_SIZE,)
+    ).fetchall()
+
+    for job in jobs:
+        # A job that raises is rolled back alone and marked failed, so it cannot hold up the queue
+        try:
+            with write_coalescer.savepoint(conn, 'application_job'):
+                result, status_code = record_application(conn, json.loads(job['payload']))
+        except Exception as e:
+            app.logger.exception('Application job %s failed', job['id'])
+            result, status_code = {'Error': f'An error occurred: {e}'}, 500
+        conn.execute('''
+            UPDATE application_jobs
+            SET status = ?, status_code = ?, result = ?, completed_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', ('done' if status_code == 200 else 'failed', status_code, json.dumps(result), job['id']))
+
+    return len(jobs)
+
+def has_queued_applications():
+    # A plain read on disk: the replica may not have the newest jobs yet, and a write unit would commit
+    with pooled_connection() as conn:
+        return conn.execute("SELECT 1 FROM application_jobs WHERE status = 'queued' LIMIT 1").fetchone() is not None
+
+class ApplicationJobWorker:
+    """Background thread that drains application_jobs in batches through the write coalescer."""
+
+    def __init__(self):
+        self._thread = None
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='application-job-worker', daemon=True)
+                self._thread.start()
+
+    def notify(self):
+        self._wakeup.set()
+
+    def _run(self):
+        while True:
+            try:
+                # Keep draining while full batches come back; otherwise wait for new work.
+                # Other processes enqueue too, hence the poll interval. An idle poll only reads,
+                # so it neither takes the write lock nor counts towards READ_REPLICA_COMMITS.
+                if has_queued_applications():
+                    while write_coalescer.execute(decide_queued_applications) == APPLICATION_JOB_BATCH_SIZE:
+                        pass
+            except Exception:
+                app.logger.exception('Application job batch failed')
+            self._wakeup.wait(APPLICATION_JOB_POLL_INTERVAL)
+            self._wakeup.clear()
+
+application_job_worker = ApplicationJobWorker()
+
+def enqueue_application(application_data):
+    job_id = write_coalescer.execute(
+        lambda conn: conn.execute(
+            'INSERT INTO application_jobs (payload) VALUES (?)', (json.dumps(application_data),)
+        ).lastrowid
+    )
+
+    application_job_worker.start()
+    application_job_worker.notify()
+    return {
+        'message': 'Application accepted for processing',
+        'job_id': job_id,
+        'status_url': f'/api/applications/jobs/{job_id}'
+    }, 202
+
+@app.route('/api/applications/jobs/<int:job_id>', methods=['GET'])
+@jwt_required()
+def get_application_job(job_id):
+    conn = get_db_connection()
+    job = conn.execute('SELECT * FROM application_jobs WHERE id = ?', (job_id,)).fetchone()
+
+    if job is None:
+        return jsonify({'message': 'Application job not found.'}), 404
+
+    return jsonify({
+        'job_id': job['id'],
+        'status': job['status'],
+        'status_code': job['status_code'],
+        'result': json.loads(job['result']) if job['result'] else None,
+        'created_at': job['created_at'],
+        'completed_at': job['completed_at']
+    }), 200
 
 @app.route('/api/applications', methods=['POST'])
 @jwt_required()
@@ -579,46 +2379,57 @@ def add_applications():
     if current_user['role'] != 'admin':
         return jsonify({"msg": "Unauthorized access, admin only"}), 403
 
-    conn = get_db_connection()
-
     data = request.json
+    errors = application_schema.errors(data)
+    if errors:
+        return validation_failed(errors, application_example)
 
-    allowed_schemes = ["Retrenchment Assistance Scheme", "Retrenchment Assistance Scheme (families)"]
-
-    example_json = {
-        "name": "jason",
-        "date_of_birth": "1990-01-01",
-        "scheme_applied": "Retrenchment Assistance Scheme"
-    }
-
-    if not data.get('name'):
-        return jsonify({
-            'Error': 'Name is required.',
-            'Example JSON Format': example_json
-        }), 400
-        
-
-    if not data.get('date_of_birth'):
-        return jsonify({
-            'Error': 'Date of birth is required.',
-            'Example JSON Format': example_json
-        }), 400
-
-    if not data.get('scheme_applied') or data.get('scheme_applied') not in allowed_schemes:
-        return jsonify({
-            'Error': f'Scheme applied must be one of {allowed_schemes}',
-            'Example JSON Format': example_json
-        }), 400
+    if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+        return enqueue_application({key: data[key] for key in ('name', 'date_of_birth', 'scheme_applied')})
 
     return insert_application(data)
 
 @app.route('/api/household', methods=['GET'])
 @jwt_required()
 def get_household():
+    if 'stream' in request.args:
+        return stream_table('household_members', read_only=True)
+
+    household_members, next_after_id, error = fetch_page('household_members', get_read_connection())
+    if error:
+        return jsonify({'Error': error}), 400
+    return page_response(household_members, next_after_id)
+
+@app.route('/api/changes', methods=['GET'])
+@jwt_required()
+def get_changes():
+    try:
+        since = int(request.args.get('since', 0))
+        limit = int(request.args.get('limit', LIST_DEFAULT_LIMIT))
+        wait = float(request.args.get('wait', 0))
+    except ValueError:
+        return jsonify({'Error': "'since' and 'limit' must be integers and 'wait' a number of seconds."}), 400
+
+    if not 0 < limit <= LIST_MAX_LIMIT:
+        return jsonify({'Error': f"'limit' must be between 1 and {LIST_MAX_LIMIT}."}), 400
+    if not 0 <= wait <= CHANGES_MAX_WAIT:
+        return jsonify({'Error': f"'wait' must be between 0 and {CHANGES_MAX_WAIT} seconds."}), 400
+
+    # Read the primary rather than the replica, which can lag the log it is asked to follow
     conn = get_db_connection()
-    household_members = conn.execute('SELECT * FROM household_members').fetchall()
-    conn.close()
-    return jsonify([dict(row) for row in household_members])  
+    changes = change_log.fetch(conn, since, limit)
+    deadline = time.monotonic() + wait
+    while not changes:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        change_log.wait(since, min(remaining, CHANGES_POLL_INTERVAL))
+        changes = change_log.fetch(conn, since, limit)
+
+    return jsonify({
+        'changes': changes,
+        'next_since': changes[-1]['seq'] if changes else since
+    }), 200
 
 @app.errorhandler(404)
 def not_found(e):
@@ -627,17 +2438,44 @@ def not_found(e):
         'available_endpoints': [
         '/administrators',
         '/applicants',
+        '/applicants/bulk',
         '/household',
         '/schemes',
         '/applications',
+        '/applications/jobs/id',
+        '/applications/export',
+        '/changes?since=seq',
         '/scheme_benefits',
         '/scheme_criteria',
         '/schemes/eligible?applicant=id',
+        '/schemes/eligible/batch',
+        '/schemes/population',
         '/delete_scheme/id',
         '/add_scheme',
         '/login',
+        '/token/refresh',
         '/register']
     }), 404
 
+def warm_up():
+    """Loads everything a worker would otherwise build on its first requests."""
+    with app.app_context():
+        conn = get_db_connection()
+        scheme_catalog.load(conn)
+        token_revocations.load(conn)
+        # Signing one token pulls in the JWT and crypto code paths before any request needs them
+        create_access_token(identity={'username': 'warm-up', 'role': 'admin'})
+    # SQLite connections must not be shared across fork(), so the parent keeps none open
+    db_pool.close_all()
+
+def create_app():
+    """Entry point for WSGI servers: returns the application with caches already warm."""
+    warm_up()
+    return app
+
 if __name__ == '__main__':
+    start_household_summary_refresher()
+    start_read_replica_refresher()
+    start_population_snapshot_refresher()
+    application_job_worker.start()
     app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""ASGI entry point: `uvicorn asgi:application`.
+
+GET /api/schemes/eligible is served on the event loop. Its SQLite reads are awaited on a bounded
+thread pool and independent reads run concurrently; the response itself is built by the same helpers
+as the Flask view. Every other route runs the Flask app on a WSGI thread pool, so both entry points
+serve the same API.
+"""
+import asyncio, os, time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from a2wsgi import WSGIMiddleware
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+from app import (
+    app, create_app, metrics, scheme_catalog, eligibility_cache, get_db_connection, get_read_connection,
+    catalog_rules, read_eligibility_inputs, eligibility_response, parse_applicant_id,
+    start_household_summary_refresher, start_population_snapshot_refresher, start_read_replica_refresher,
+    application_job_worker
+)
+
+ASYNC_DB_THREADS = int(os.getenv('ASYNC_DB_THREADS', '8'))
+ASYNC_WSGI_THREADS = int(os.getenv('ASYNC_WSGI_THREADS', '16'))
+
+
+class DatabaseExecutor:
+    """Bounded thread pool for blocking SQLite work.
+
+    Each call runs in its own Flask app context, so it borrows connections through get_db_connection()
+    and get_read_connection() (the replica when READ_REPLICA is on) exactly as the Flask routes do.
+    """
+
+    def __init__(self, threads):
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='sqlite-reader')
+
+    def _call(self, source, fn, args):
+        # query_stats is per thread, so each call reports its own SQL rather than leaving it to the event loop
+        try:
+            with app.app_context():
+                return fn(*args)
+        finally:
+            metrics.record_sql(source)
+
+    async def run(self, fn, *args, source='sqlite-reader'):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._call, source, fn, args)
+
+
+def authenticate(authorization):
+    # The same checks as @jwt_required(), revocation included; None lets Flask produce the error response
+    with app.test_request_context(headers={'Authorization': authorization}):
+        try:
+            verify_jwt_in_request()
+        except Exception:
+            return None
+        return get_jwt_identity()
+
+
+def eligibility_inputs(applicant_id):
+    return read_eligibility_inputs(get_read_connection(), applicant_id)
+
+
+def current_catalog_rules():
+    return catalog_rules(get_db_connection())
+
+
+async def send_json(send, body, status):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+class Application:
+    def __init__(self, flask_app):
+        self.wsgi = WSGIMiddleware(flask_app, workers=ASYNC_WSGI_THREADS)
+        self.db = DatabaseExecutor(ASYNC_DB_THREADS)
+        self.routes = {('GET', '/api/schemes/eligible'): self.get_specific_scheme}
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+        handler = self.routes.get((scope.get('method'), scope.get('path')))
+        if handler is None or not await handler(scope, send):
+            await self.wsgi(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                start_household_summary_refresher()
+                start_population_snapshot_refresher()
+                start_read_replica_refresher()
+                application_job_worker.start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def get_specific_scheme(self, scope, send):
+        """Async version of app.get_specific_scheme; returns False to hand the request to Flask instead."""
+        endpoint = 'get_specific_scheme'
+        headers = dict(scope['headers'])
+        applicant_id = parse_applicant_id(parse_qs(scope['query_string'].decode()).get('applicant', [''])[0])
+        # Missing or malformed input and auth failures take the Flask route for its exact error responses
+        if applicant_id is None:
+            return False
+        identity = await self.db.run(authenticate, headers.get(b'authorization', b'').decode(), source=endpoint)
+        if identity is None or identity.get('role') != 'admin':
+            return False
+
+        started = time.perf_counter()
+        metrics.request_started()
+        status_code = 500
+        try:
+            status_code = await self.eligible_schemes(send, endpoint, applicant_id)
+        finally:
+            metrics.request_finished(endpoint, 'GET', status_code, time.perf_counter() - started)
+        return True
+
+    async def eligible_schemes(self, send, endpoint, applicant_id):
+        # Only a stale catalog needs a second lookup once its current version is known, so each request counts once
+        fresh = scheme_catalog.is_fresh()
+        cached = eligibility_cache.get(applicant_id, scheme_catalog.version) if fresh else None
+        if cached is None:
+            (catalog_version, rules), (generation, applicant, summary) = await asyncio.gather(
+                self.db.run(current_catalog_rules, source=endpoint),
+                self.db.run(eligibility_inputs, applicant_id, source=endpoint),
+            )
+            if not fresh:
+                cached = eligibility_cache.get(applicant_id, catalog_version)
+            if cached is None:
+                cached = eligibility_response(applicant_id, applicant, summary, rules, generation, catalog_version)
+
+        body, status_code = cached
+        await send_json(send, body, status_code)
+        return status_code
+
+
+application = Application(create_app())
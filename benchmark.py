@@ -0,0 +1,298 @@
+"""Endpoint load test: runs the app in-process against a seeded temporary database.
+
+Example:
+    python benchmark.py --applicants 10000 --concurrency 16 --duration 30 --output results.json
+    python benchmark.py --mix eligibility=5,list_applicants=1 --compare results.json
+"""
+import argparse, http.client, json, logging, os, random, shutil, sqlite3, sys, tempfile, threading, time
+from collections import Counter
+from datetime import datetime
+
+DEFAULT_MIX = {
+    'login': 1,
+    'create_applicant': 2,
+    'eligibility': 6,
+    'submit_application': 2,
+    'list_applicants': 2,
+    'list_household': 1,
+    'list_applications': 1,
+    'schemes': 2,
+}
+
+# Statuses each operation returns when it works; anything else, or no response at all, counts as an error.
+# Eligibility answers 400 for applicants who are not unemployed.
+EXPECTED_STATUSES = {
+    'login': {200},
+    'create_applicant': {200},
+    'eligibility': {200, 400},
+    'submit_application': {200},
+    'list_applicants': {200},
+    'list_household': {200},
+    'list_applications': {200},
+    'schemes': {200},
+}
+
+USERNAME = 'benchmark'
+PASSWORD = 'benchmark'
+FIRST_NAMES = ['Mary', 'Jason', 'Gwen', 'Jayden', 'Aisha', 'Wei Ling', 'Ravi', 'Siti', 'Daniel', 'Mei']
+
+
+def parse_mix(value):
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f'Unknown operation {name!r}. Choose from {list(DEFAULT_MIX)}.')
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def random_person(rng, today_year):
+    return {
+        'name': rng.choice(FIRST_NAMES),
+        'employment_status': rng.choice(['employed', 'unemployed']),
+        'sex': rng.choice(['male', 'female']),
+        'date_of_birth': f'{rng.randint(today_year - 70, today_year - 20)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+        'marital_status': rng.choice(['single', 'married', 'widowed', 'divorced']),
+    }
+
+
+def random_household(rng, today_year):
+    household = []
+    for _ in range(rng.choice([0, 0, 1, 2, 3])):
+        relation = rng.choice(['son', 'daughter'])
+        household.append({
+            'name': rng.choice(FIRST_NAMES),
+            'employment_status': 'unemployed',
+            'sex': 'male' if relation == 'son' else 'female',
+            'date_of_birth': f'{rng.randint(today_year - 20, today_year)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'relation': relation,
+        })
+    return household
+
+
+def seed(database, applicants, seed_value, application_rate):
+    import init_db
+
+    conn = sqlite3.connect(database)
+    init_db.migrate(conn)
+    init_db.generate_population(conn, applicants, seed=seed_value, application_rate=application_rate)
+    rows = conn.execute('SELECT id, name, date_of_birth FROM applicants ORDER BY id').fetchall()
+    conn.close()
+    return rows
+
+
+class Client:
+    """One keep-alive HTTP connection per benchmark thread."""
+
+    def __init__(self, host, port):
+        self.conn = http.client.HTTPConnection(host, port, timeout=60)
+        self.token = None
+
+    def request(self, method, path, body=None):
+        status, data = self.send(method, path, body)
+        # Access tokens expire during long runs; log in again once rather than timing a stream of 401s
+        if status == 401 and self.token and self.login() == 200:
+            status, data = self.send(method, path, body)
+        return status, data
+
+    def send(self, method, path, body=None):
+        headers = {}
+        if body is not None:
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        self.conn.request(method, path, body=body, headers=headers)
+        response = self.conn.getresponse()
+        return response.status, response.read()
+
+    def login(self):
+        status, body = self.send('POST', '/api/login', {'username': USERNAME, 'password': PASSWORD})
+        if status == 200:
+            self.token = json.loads(body)['access_token']
+        return status
+
+
+def run_operation(name, client, rng, applicants, year):
+    if name == 'login':
+        return client.login()
+    if name == 'create_applicant':
+        body = random_person(rng, year)
+        body['household'] = random_household(rng, year)
+        return client.request('POST', '/api/applicants', body)[0]
+    if name == 'eligibility':
+        applicant_id = rng.choice(applicants)[0]
+        return client.request('GET', f'/api/schemes/eligible?applicant={applicant_id}')[0]
+    if name == 'submit_application':
+        _, applicant_name, date_of_birth = rng.choice(applicants)
+        return client.request('POST', '/api/applications', {
+            'name': applicant_name,
+            'date_of_birth': date_of_birth,
+            'scheme_applied': 'Retrenchment Assistance Scheme',
+        })[0]
+    # Start just before a seeded applicant so the page is never empty (an empty page is a 404)
+    if name == 'list_applicants':
+        return client.request('GET', f'/api/applicants?limit=100&after_id={rng.choice(applicants)[0] - 1}')[0]
+    if name == 'list_household':
+        return client.request('GET', f'/api/household?limit=100&after_id={rng.choice(applicants)[0] - 1}')[0]
+    if name == 'list_applications':
+        return client.request('GET', '/api/applications?limit=100')[0]
+    if name == 'schemes':
+        return client.request('GET', '/api/schemes')[0]
+    raise ValueError(name)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(samples, elapsed):
+    results = {}
+    for name, (latencies, statuses) in sorted(samples.items()):
+        latencies = sorted(latencies)
+        count = len(latencies)
+        results[name] = {
+            'requests': count,
+            'errors': sum(n for status, n in statuses.items() if status not in EXPECTED_STATUSES[name]),
+            # JSON object keys are strings; 'none' counts requests that got no response
+            'statuses': {str(status).lower(): n for status, n in sorted(statuses.items(), key=lambda item: item[0] or 0)},
+            'throughput_rps': round(count / elapsed, 2),
+            'mean_ms': round(sum(latencies) / count * 1000, 3) if count else None,
+            'p50_ms': round(percentile(latencies, 0.50) * 1000, 3) if count else None,
+            'p95_ms': round(percentile(latencies, 0.95) * 1000, 3) if count else None,
+            'p99_ms': round(percentile(latencies, 0.99) * 1000, 3) if count else None,
+            'max_ms': round(latencies[-1] * 1000, 3) if count else None,
+        }
+    return results
+
+
+def print_table(results, baseline=None):
+    header = f"{'operation':<20}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print(header)
+    print('-' * len(header))
+    for name, stats in results.items():
+        line = (f"{name:<20}{stats['requests']:>10}{stats['errors']:>8}{stats['throughput_rps']:>10}"
+                f"{stats['p50_ms'] or '-':>10}{stats['p95_ms'] or '-':>10}{stats['p99_ms'] or '-':>10}")
+        previous = (baseline or {}).get(name)
+        if previous and previous.get('p95_ms') and stats['p95_ms']:
+            change = (stats['p95_ms'] - previous['p95_ms']) / previous['p95_ms'] * 100
+            line += f"   p95 {change:+.1f}% vs baseline"
+        print(line)
+    for name, stats in results.items():
+        if stats['errors']:
+            print(f"{name}: errors by status {stats['statuses']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--applicants', type=int, default=5000, help='applicants to seed (default 5000)')
+    parser.add_argument('--concurrency', type=int, default=8, help='client threads (default 8)')
+    parser.add_argument('--duration', type=float, default=20, help='seconds to run (default 20)')
+    parser.add_argument('--warmup', type=float, default=2, help='seconds to run before measuring (default 2)')
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX, help='weights, e.g. eligibility=5,login=1')
+    parser.add_argument('--application-rate', type=float, default=0.3,
+                        help='share of seeded applicants with an application (default 0.3)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed for data and request mix')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--compare', help='earlier JSON results to compare p95 latency against')
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='benchmark-')
+    database = os.path.join(workdir, 'database.db')
+    # app.py reads its configuration at import time
+    os.environ['DATABASE'] = database
+    os.environ.setdefault('JWT_SECRET_KEY', 'benchmark-secret-key-with-enough-bytes')
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    try:
+        print(f'Seeding {args.applicants} applicants into {database}')
+        applicants = seed(database, args.applicants, args.seed, args.application_rate)
+
+        import app as application
+        from werkzeug.serving import make_server, WSGIRequestHandler
+
+        with application.pooled_connection() as conn:
+            application.rebuild_household_summaries(conn)
+            conn.commit()
+
+        WSGIRequestHandler.protocol_version = 'HTTP/1.1'
+        logging.getLogger('werkzeug').setLevel(logging.ERROR)
+        server = make_server('127.0.0.1', 0, application.create_app(), threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = '127.0.0.1', server.server_port
+
+        setup = Client(host, port)
+        setup.request('POST', '/api/register', {'username': USERNAME, 'password': PASSWORD})
+
+        names = list(args.mix)
+        weights = [args.mix[name] for name in names]
+        samples = {name: ([], Counter()) for name in names}
+        samples_lock = threading.Lock()
+        measure_from = time.monotonic() + args.warmup
+        stop_at = measure_from + args.duration
+        year = datetime.now().year
+
+        def worker(worker_seed):
+            worker_rng = random.Random(worker_seed)
+            client = Client(host, port)
+            client.login()
+            while True:
+                name = worker_rng.choices(names, weights)[0]
+                started = time.monotonic()
+                if started >= stop_at:
+                    return
+                try:
+                    status = run_operation(name, client, worker_rng, applicants, year)
+                except (OSError, http.client.HTTPException):
+                    client = Client(host, port)
+                    client.login()
+                    status = None
+                finished = time.monotonic()
+                if started < measure_from:
+                    continue
+                with samples_lock:
+                    latencies, statuses = samples[name]
+                    latencies.append(finished - started)
+                    statuses[status] += 1
+
+        print(f'Running {args.concurrency} clients for {args.duration}s (after {args.warmup}s warm-up)')
+        threads = [threading.Thread(target=worker, args=(args.seed * 1000 + i,)) for i in range(args.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        server.shutdown()
+
+        results = summarize(samples, args.duration)
+        baseline = None
+        if args.compare:
+            with open(args.compare) as f:
+                baseline = json.load(f)['results']
+        print_table(results, baseline)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump({
+                    'started_at': datetime.now().isoformat(timespec='seconds'),
+                    'config': {
+                        'applicants': args.applicants,
+                        'concurrency': args.concurrency,
+                        'duration': args.duration,
+                        'warmup': args.warmup,
+                        'mix': args.mix,
+                        'application_rate': args.application_rate,
+                        'seed': args.seed,
+                    },
+                    'results': results,
+                }, f, indent=2)
+            print(f'Results written to {args.output}')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
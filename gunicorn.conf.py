@@ -0,0 +1,31 @@
+import multiprocessing, os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# Pre-forked worker processes, each serving requests on a small thread pool
+workers = int(os.getenv('WEB_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.getenv('WEB_THREADS', '4'))
+worker_class = 'gthread'
+
+# Import the app and warm its caches once in the master before forking
+preload_app = True
+
+# Recycle workers after a bounded number of requests; jitter keeps them from restarting together
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', '10000'))
+max_requests_jitter = int(os.getenv('WEB_MAX_REQUESTS_JITTER', '1000'))
+
+# Seconds a worker gets to finish in-flight requests on restart or shutdown
+graceful_timeout = int(os.getenv('WEB_GRACEFUL_TIMEOUT', '30'))
+timeout = int(os.getenv('WEB_TIMEOUT', '60'))
+
+accesslog = '-'
+
+
+def post_worker_init(worker):
+    from app import (start_household_summary_refresher, start_population_snapshot_refresher,
+                     start_read_replica_refresher, application_job_worker)
+    start_household_summary_refresher()
+    start_read_replica_refresher()
+    start_population_snapshot_refresher()
+    # Also drains jobs left queued by a previous run
+    application_job_worker.start()
@@ -1,89 +1,7 @@
-import sqlite3
+import sqlite3, os, argparse, random, time
+from datetime import datetime
 
-connection = sqlite3.connect('database.db')
-cursor = connection.cursor()
-
-cursor.execute("DROP TABLE IF EXISTS administrators")
-cursor.execute("DROP TABLE IF EXISTS applicants")
-cursor.execute("DROP TABLE IF EXISTS schemes")
-cursor.execute("DROP TABLE IF EXISTS applications")
-cursor.execute("DROP TABLE IF EXISTS household_members")
-cursor.execute("DROP TABLE IF EXISTS criteria")
-cursor.execute("DROP TABLE IF EXISTS benefits")
-
-cursor.execute('''
-    CREATE TABLE IF NOT EXISTS administrators (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT UNIQUE NOT NULL,
-        password TEXT NOT NULL
-    )
-''')
-
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS applicants (
-    id INTEGER PRIMARY KEY,
-    name TEXT NOT NULL,
-    marital_status TEXT NOT NULL,
-    employment_status TEXT NOT NULL,
-    sex TEXT NOT NULL,
-    date_of_birth DATE NOT NULL
-)
-''')
-
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS household_members (
-    id INTEGER PRIMARY KEY,
-    applicant_id INTEGER NOT NULL,
-    name TEXT NOT NULL,
-    employment_status TEXT NOT NULL,
-    sex TEXT NOT NULL,
-    date_of_birth DATE NOT NULL,
-    relation TEXT NOT NULL,
-    FOREIGN KEY (applicant_id) REFERENCES applicants (id)
-)
-''')
-
-cursor.execute('''
-    CREATE TABLE IF NOT EXISTS applications (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        applicant_id INTEGER NOT NULL,
-        scheme_applied TEXT NOT NULL,
-        name TEXT NOT NULL,
-        date_of_birth TEXT NOT NULL,
-        eligible TEXT NOT NULL,
-        application_status TEXT NOT NULL
-    )
-''')
-
-cursor.execute('''
-    CREATE TABLE IF NOT EXISTS schemes (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL
-)
-''')
-
-cursor.execute('''
-    CREATE TABLE IF NOT EXISTS criteria (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    scheme_id INTEGER NOT NULL,
-    scheme_name TEXT NOT NULL,
-    employment_status TEXT,
-    children_required BOOLEAN,
-    school_level TEXT,
-    FOREIGN KEY (scheme_id) REFERENCES schemes(id)
-);
-''')
-
-cursor.execute('''
-    CREATE TABLE IF NOT EXISTS benefits (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    scheme_id TEXT NOT NULL,
-    scheme_name TEXT NOT NULL,
-    name TEXT NOT NULL,
-    amount REAL,
-    FOREIGN KEY (scheme_id) REFERENCES schemes(id)
-)
-''')
+DATABASE = os.getenv('DATABASE', 'database.db')
 
 data = {
         "schemes": [
@@ -130,7 +48,7 @@ data = {
     }
 
 
-def insert_scheme_data(data):
+def insert_scheme_data(cursor, data):
     for scheme in data['schemes']:
         scheme_name = scheme['name']
 
@@ -161,7 +79,402 @@ def insert_scheme_data(data):
                 VALUES (?, ?, ?, ?)
             ''', (scheme_id, scheme_name, benefit_name, benefit_amount))
 
-insert_scheme_data(data)
 
-connection.commit()
-connection.close()
+def create_tables(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS administrators (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL
+        )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS applicants (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        marital_status TEXT NOT NULL,
+        employment_status TEXT NOT NULL,
+        sex TEXT NOT NULL,
+        date_of_birth DATE NOT NULL
+    )
+    ''')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS household_members (
+        id INTEGER PRIMARY KEY,
+        applicant_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        employment_status TEXT NOT NULL,
+        sex TEXT NOT NULL,
+        date_of_birth DATE NOT NULL,
+        relation TEXT NOT NULL,
+        FOREIGN KEY (applicant_id) REFERENCES applicants (id)
+    )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS applications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            applicant_id INTEGER NOT NULL,
+            scheme_applied TEXT NOT NULL,
+            name TEXT NOT NULL,
+            date_of_birth TEXT NOT NULL,
+            eligible TEXT NOT NULL,
+            application_status TEXT NOT NULL
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schemes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL
+    )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS criteria (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        scheme_id INTEGER NOT NULL,
+        scheme_name TEXT NOT NULL,
+        employment_status TEXT,
+        children_required BOOLEAN,
+        school_level TEXT,
+        FOREIGN KEY (scheme_id) REFERENCES schemes(id)
+    );
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS benefits (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        scheme_id TEXT NOT NULL,
+        scheme_name TEXT NOT NULL,
+        name TEXT NOT NULL,
+        amount REAL,
+        FOREIGN KEY (scheme_id) REFERENCES schemes(id)
+    )
+    ''')
+
+    # Only seed a brand-new database; existing catalogs are left alone
+    if cursor.execute('SELECT COUNT(*) FROM schemes').fetchone()[0] == 0:
+        insert_scheme_data(cursor, data)
+
+
+def fix_benefits_scheme_id(cursor):
+    # SQLite cannot change a column's type in place, so rebuild the table with INTEGER affinity
+    cursor.execute('''
+        CREATE TABLE benefits_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        scheme_id INTEGER NOT NULL,
+        scheme_name TEXT NOT NULL,
+        name TEXT NOT NULL,
+        amount REAL,
+        FOREIGN KEY (scheme_id) REFERENCES schemes(id)
+    )
+    ''')
+    cursor.execute('''
+        INSERT INTO benefits_new (id, scheme_id, scheme_name, name, amount)
+        SELECT id, CAST(scheme_id AS INTEGER), scheme_name, name, amount FROM benefits
+    ''')
+    cursor.execute('DROP TABLE benefits')
+    cursor.execute('ALTER TABLE benefits_new RENAME TO benefits')
+
+
+def create_indexes(cursor):
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_household_members_applicant_id ON household_members (applicant_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applicants_name_dob ON applicants (name, date_of_birth)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_criteria_scheme_id ON criteria (scheme_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_benefits_scheme_id ON benefits (scheme_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_applicant_id ON applications (applicant_id)')
+
+
+def create_catalog_version(cursor):
+    # Bumped by triggers on every catalog write so each app process can tell when its cache is stale
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS catalog_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 1)')
+
+    for table in ('schemes', 'criteria', 'benefits'):
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS bump_catalog_version_{table}_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+                END
+            ''')
+
+
+def create_token_revocations(cursor):
+    # Tokens for a username issued at or before revoked_at (unix seconds) are rejected
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS token_revocations (
+            username TEXT PRIMARY KEY,
+            revoked_at INTEGER NOT NULL
+        )
+    ''')
+
+
+def create_household_summary(cursor):
+    # One row per applicant, kept up to date by the app whenever an applicant or household is written.
+    # The *_school_children columns count children whose age falls in each school level's band
+    # as of as_of_year; existing data is filled in by `flask --app app rebuild-household-summaries`.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS applicant_household_summary (
+            applicant_id INTEGER PRIMARY KEY,
+            child_count INTEGER NOT NULL,
+            youngest_child_dob TEXT,
+            oldest_child_dob TEXT,
+            employed_members INTEGER NOT NULL,
+            primary_school_children INTEGER NOT NULL,
+            secondary_school_children INTEGER NOT NULL,
+            as_of_year INTEGER NOT NULL,
+            FOREIGN KEY (applicant_id) REFERENCES applicants (id)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_household_summary_as_of_year ON applicant_household_summary (as_of_year)')
+
+
+def create_application_jobs(cursor):
+    # Durable queue for applications accepted with ?async=true and decided by a background worker
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS application_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            status_code INTEGER,
+            result TEXT,
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            completed_at TEXT
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_application_jobs_status ON application_jobs (status, id)')
+
+
+def add_application_submitted_at(cursor):
+    # Lets exports select applications by when they were submitted; rows from before this migration stay NULL
+    cursor.execute('ALTER TABLE applications ADD COLUMN submitted_at TEXT')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_submitted_at ON applications (submitted_at)')
+
+
+def create_change_log(cursor):
+    # One row per committed write, in commit order, for GET /api/changes; AUTOINCREMENT never reuses a seq
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity TEXT NOT NULL,
+            entity_id INTEGER NOT NULL,
+            operation TEXT NOT NULL,
+            data TEXT,
+            changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+
+# Applied in order; PRAGMA user_version records the last one that ran
+MIGRATIONS = [
+    (1, 'Create tables and seed schemes', create_tables),
+    (2, 'Store benefits.scheme_id as INTEGER', fix_benefits_scheme_id),
+    (3, 'Index foreign keys and applicant lookups', create_indexes),
+    (4, 'Track scheme catalog version', create_catalog_version),
+    (5, 'Add token revocation list', create_token_revocations),
+    (6, 'Add per-applicant household summary', create_household_summary),
+    (7, 'Add application job queue', create_application_jobs),
+    (8, 'Record when applications are submitted', add_application_submitted_at),
+    (9, 'Add change log', create_change_log),
+]
+
+
+def migrate(connection):
+    connection.isolation_level = None
+    cursor = connection.cursor()
+    current_version = cursor.execute('PRAGMA user_version').fetchone()[0]
+
+    for version, description, apply in MIGRATIONS:
+        if version <= current_version:
+            continue
+
+        # Each migration and its version bump commit together, so a failed step is retried on the next run
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            apply(cursor)
+            cursor.execute(f'PRAGMA user_version = {version}')
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+        print(f'Applied migration {version}: {description}')
+
+    return max(current_version, MIGRATIONS[-1][0])
+
+
+FIRST_NAMES = [
+    'Mary', 'Jason', 'Gwen', 'Jayden', 'Aisha', 'Wei Ling', 'Ravi', 'Siti', 'Daniel', 'Mei', 'Ahmad', 'Priya',
+    'Kumar', 'Hui Min', 'Nurul', 'Marcus', 'Farah', 'Jun Jie', 'Lakshmi', 'Ethan', 'Zoe', 'Hafiz', 'Chloe', 'Arjun',
+]
+LAST_NAMES = [
+    'Tan', 'Lim', 'Lee', 'Ng', 'Ong', 'Wong', 'Goh', 'Chua', 'Koh', 'Teo', 'Rahman', 'Ismail', 'Abdullah',
+    'Kumar', 'Pillai', 'Nair', 'Singh', 'Fernandez', 'Chen', 'Ho',
+]
+MARITAL_STATUS_WEIGHTS = {'single': 35, 'married': 50, 'divorced': 10, 'widowed': 5}
+# Weights for having 0-4 children, by marital status
+CHILD_COUNT_WEIGHTS = {
+    'single': [80, 12, 6, 2, 0],
+    'married': [30, 22, 30, 13, 5],
+    'divorced': [40, 30, 22, 6, 2],
+    'widowed': [35, 25, 25, 10, 5],
+}
+EMPLOYMENT_RATE = 0.7
+
+# Dropped for the duration of a bulk load and rebuilt by create_indexes afterwards
+BULK_LOAD_DEFERRED_INDEXES = [
+    'idx_household_members_applicant_id',
+    'idx_applicants_name_dob',
+    'idx_applications_applicant_id',
+]
+
+
+def random_date(rng, year):
+    return f'{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}'
+
+
+def random_employment_status(rng):
+    return 'employed' if rng.random() < EMPLOYMENT_RATE else 'unemployed'
+
+
+def generate_household(rng, applicant, birth_year, as_of_year):
+    last_name = applicant['name'].rsplit(' ', 1)[-1]
+    members = []
+
+    if applicant['marital_status'] == 'married':
+        members.append((
+            f'{rng.choice(FIRST_NAMES)} {last_name}',
+            random_employment_status(rng),
+            'female' if applicant['sex'] == 'male' else 'male',
+            random_date(rng, min(as_of_year - 18, birth_year + rng.randint(-5, 5))),
+            'spouse',
+        ))
+
+    # Children are born while the parent is 20-42, most often around 31, and never in the future
+    for _ in range(rng.choices(range(5), CHILD_COUNT_WEIGHTS[applicant['marital_status']])[0]):
+        child_birth_year = birth_year + round(rng.triangular(20, 42, 31))
+        if child_birth_year > as_of_year:
+            continue
+        sex = rng.choice(['male', 'female'])
+        members.append((
+            f'{rng.choice(FIRST_NAMES)} {last_name}',
+            random_employment_status(rng) if as_of_year - child_birth_year >= 18 else 'unemployed',
+            sex,
+            random_date(rng, child_birth_year),
+            'son' if sex == 'male' else 'daughter',
+        ))
+
+    return members
+
+
+def generate_applicant(rng, as_of_year):
+    birth_year = as_of_year - round(rng.triangular(20, 75, 40))
+    applicant = {
+        'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+        'marital_status': rng.choices(list(MARITAL_STATUS_WEIGHTS), list(MARITAL_STATUS_WEIGHTS.values()))[0],
+        'employment_status': random_employment_status(rng),
+        'sex': rng.choice(['male', 'female']),
+        'date_of_birth': random_date(rng, birth_year),
+    }
+    return applicant, generate_household(rng, applicant, birth_year, as_of_year)
+
+
+def generate_population(connection, count, seed=0, batch_size=50000, application_rate=0.3, as_of_year=None):
+    """Appends `count` synthetic applicants with households and applications; a given seed always yields the same data."""
+    if as_of_year is None:
+        as_of_year = datetime.now().year
+    rng = random.Random(seed)
+
+    connection.isolation_level = None
+    cursor = connection.cursor()
+    # A half-finished synthetic load is simply regenerated, so skip the fsyncs while loading
+    cursor.execute('PRAGMA synchronous = OFF')
+
+    scheme_names = [row[0] for row in cursor.execute('SELECT name FROM schemes ORDER BY id')]
+    first_id = cursor.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM applicants').fetchone()[0]
+    end_id = first_id + count
+
+    for index in BULK_LOAD_DEFERRED_INDEXES:
+        cursor.execute(f'DROP INDEX IF EXISTS {index}')
+
+    totals = {'applicants': 0, 'household_members': 0, 'applications': 0}
+    started = time.monotonic()
+    try:
+        for batch_start in range(first_id, end_id, batch_size):
+            applicant_rows, member_rows, application_rows = [], [], []
+
+            for applicant_id in range(batch_start, min(batch_start + batch_size, end_id)):
+                applicant, household = generate_applicant(rng, as_of_year)
+                applicant_rows.append((applicant_id, applicant['name'], applicant['marital_status'],
+                                       applicant['employment_status'], applicant['sex'], applicant['date_of_birth']))
+                member_rows.extend((applicant_id,) + member for member in household)
+
+                # Every seeded scheme requires unemployment, so that alone decides the outcome
+                if scheme_names and rng.random() < application_rate:
+                    eligible = applicant['employment_status'] == 'unemployed'
+                    application_rows.append((
+                        applicant_id, rng.choice(scheme_names), applicant['name'], applicant['date_of_birth'],
+                        'yes' if eligible else 'no', 'approved' if eligible else 'denied',
+                        f'{random_date(rng, as_of_year - 1)} {rng.randint(8, 19):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}',
+                    ))
+
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany('''
+                    INSERT INTO applicants (id, name, marital_status, employment_status, sex, date_of_birth)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', applicant_rows)
+                cursor.executemany('''
+                    INSERT INTO household_members (applicant_id, name, employment_status, sex, date_of_birth, relation)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', member_rows)
+                cursor.executemany('''
+                    INSERT INTO applications (applicant_id, scheme_applied, name, date_of_birth, eligible, application_status, submitted_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', application_rows)
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+
+            totals['applicants'] += len(applicant_rows)
+            totals['household_members'] += len(member_rows)
+            totals['applications'] += len(application_rows)
+            rate = totals['applicants'] / max(time.monotonic() - started, 1e-9)
+            print(f"Loaded {totals['applicants']}/{count} applicants ({rate:.0f}/s)")
+    finally:
+        print('Rebuilding indexes')
+        create_indexes(cursor)
+        cursor.execute('ANALYZE')
+        cursor.execute('PRAGMA synchronous = FULL')
+
+    return totals
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Create or migrate the database, optionally adding synthetic data.')
+    parser.add_argument('--generate', type=int, metavar='N', help='append N synthetic applicants after migrating')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for generated data (default 0)')
+    parser.add_argument('--batch-size', type=int, default=50000, help='applicants per transaction (default 50000)')
+    parser.add_argument('--application-rate', type=float, default=0.3,
+                        help='share of generated applicants with an application (default 0.3)')
+    parser.add_argument('--as-of-year', type=int, help='year generated ages are relative to (default: this year)')
+    args = parser.parse_args()
+
+    connection = sqlite3.connect(DATABASE)
+    migrate(connection)
+    if args.generate:
+        totals = generate_population(connection, args.generate, args.seed, args.batch_size,
+                                     args.application_rate, args.as_of_year)
+        print(f"Generated {totals['applicants']} applicants, {totals['household_members']} household members "
+              f"and {totals['applications']} applications")
+    connection.close()
@@ -0,0 +1,92 @@
+"""Declarative validation for JSON request bodies.
+
+A Schema is compiled once, at import time, into a flat tuple of checks. Schema.errors() runs every check
+and returns all error messages for a record, so single-record handlers and bulk imports report the
+same messages at the same cost.
+"""
+
+
+def is_choice(value, choices):
+    try:
+        return value in choices
+    except TypeError:
+        # Unhashable values such as lists or objects are never valid choices
+        return False
+
+
+class Field:
+    """One key of a JSON object and the rules its value must satisfy.
+
+    required:    the key must be present; unless allow_empty, its value must also be truthy.
+    choices:     allowed values, checked with a frozenset lookup.
+    types:       the value must be an instance of these types.
+    schema:      the value must be an object matching this Schema.
+    items:       the value must be a list whose elements are objects matching this Schema.
+    Messages may use {name}, which is filled with the record's own 'name' value.
+    """
+
+    def __init__(self, key, required=True, allow_empty=False, choices=None, types=None, schema=None, items=None,
+                 message=None, choices_message=None, type_message=None, item_message=None):
+        self.key = key
+        self.required = required
+        self.allow_empty = allow_empty
+        self.choices = frozenset(choices) if choices is not None else None
+        self.types = types
+        self.schema = schema
+        self.items = items
+        self.message = message or f"'{key}' is required."
+        self.choices_message = choices_message or self.message
+        self.type_message = type_message or self.message
+        self.item_message = item_message or self.type_message
+
+
+class Schema:
+    def __init__(self, *fields):
+        self.fields = fields
+        self._checks = tuple(self._compile(field) for field in fields)
+
+    def _compile(self, field):
+        key, required, allow_empty = field.key, field.required, field.allow_empty
+        choices, types, schema, items = field.choices, field.types, field.schema, field.items
+        missing = object()
+
+        def check(record, errors):
+            value = record.get(key, missing)
+            if value is missing or (not allow_empty and not value):
+                if required:
+                    errors.append(field.message.format(name=record.get('name')))
+                return
+            if choices is not None and not is_choice(value, choices):
+                errors.append(field.choices_message.format(name=record.get('name')))
+                return
+            if types is not None and not isinstance(value, types):
+                errors.append(field.type_message.format(name=record.get('name')))
+                return
+            if schema is not None:
+                if not isinstance(value, dict):
+                    errors.append(field.type_message.format(name=record.get('name')))
+                    return
+                schema.collect(value, errors)
+            if items is not None:
+                if not isinstance(value, list):
+                    errors.append(field.type_message.format(name=record.get('name')))
+                    return
+                for item in value:
+                    if not isinstance(item, dict):
+                        errors.append(field.item_message.format(name=record.get('name')))
+                        continue
+                    items.collect(item, errors)
+
+        return check
+
+    def collect(self, record, errors):
+        for check in self._checks:
+            check(record, errors)
+
+    def errors(self, record):
+        """Every problem with `record`, in field order; empty when it is valid."""
+        if not isinstance(record, dict):
+            return ['Request body must be a JSON object.']
+        errors = []
+        self.collect(record, errors)
+        return errors
@@ -0,0 +1,4 @@
+from app import create_app
+
+# Imported once in the gunicorn master (preload_app), then shared with every forked worker
+application = create_app()